@@ -28,15 +28,16 @@ from contrast_game import (  # type: ignore  # pylint: disable=import-error
     TILE_GRAY,
     TILE_WHITE,
     ContrastGame,
-    decode_action,
+    decode_action_fast,
 )
 from logger import setup_logger  # type: ignore  # pylint: disable=import-error
 from mcts import MCTS  # type: ignore  # pylint: disable=import-error
-from model import ContrastDualPolicyNet  # type: ignore  # pylint: disable=import-error
+from model import ContrastDualPolicyNet, compile_for_inference  # type: ignore  # pylint: disable=import-error
 
 BOARD_W = 5
 BOARD_H = 5
 LOGGER = logging.getLogger("alphazero_bot")
+_YOU_ARE_RE = re.compile(r"You are\s+([XO])")
 
 
 @dataclass
@@ -151,10 +152,10 @@ def snapshot_to_game(
             game.tiles[y, x] = TILE_WHITE
 
     # Stock counts default to current values if missing
-    game.tile_counts[0, 0] = snapshot.stock_black.get("X", int(game.tile_counts[0, 0]))
-    game.tile_counts[1, 0] = snapshot.stock_black.get("O", int(game.tile_counts[1, 0]))
-    game.tile_counts[0, 1] = snapshot.stock_gray.get("X", int(game.tile_counts[0, 1]))
-    game.tile_counts[1, 1] = snapshot.stock_gray.get("O", int(game.tile_counts[1, 1]))
+    game.tc_p1_b = snapshot.stock_black.get("X", game.tc_p1_b)
+    game.tc_p2_b = snapshot.stock_black.get("O", game.tc_p2_b)
+    game.tc_p1_g = snapshot.stock_gray.get("X", game.tc_p1_g)
+    game.tc_p2_g = snapshot.stock_gray.get("O", game.tc_p2_g)
 
     game.current_player = P1 if snapshot.turn == "X" else P2
     game.game_over = snapshot.status != "ongoing"
@@ -166,18 +167,13 @@ def snapshot_to_game(
         game.winner = 0
 
     game.move_count = move_count
+    game.sync_positions()
 
-    # rebuild history cache for encoder
-    game.history.clear()
-    for entry in history_cache:
-        game.history.append(entry)
-    game.history.appendleft(
-        (
-            game.pieces.copy(),
-            game.tiles.copy(),
-            game.tile_counts.copy(),
-        )
-    )
+    # rebuild history cache for encoder (oldest first so the snapshot ends up newest)
+    game.clear_history()
+    for entry in reversed(history_cache):
+        game.push_history(*entry)
+    game.push_history(game.pieces, game.tiles, game.get_tile_counts())
 
     return game
 
@@ -195,6 +191,8 @@ class AlphaZeroBot:
         model_name: str,
         weights_path: Path,
         num_simulations: int,
+        batch_size: int = 16,
+        compile_network: bool = False,
     ) -> None:
         self.host = host
         self.port = port
@@ -202,7 +200,7 @@ class AlphaZeroBot:
         self.nickname = name
         self.model_name = model_name or "alphazero"
         self.socket: Optional[socket.socket] = None
-        self.buffer = ""
+        self.buffer = bytearray()
         self.collecting_state = False
         self.state_lines: List[str] = []
         self.player_role: Optional[str] = None
@@ -226,16 +224,27 @@ class AlphaZeroBot:
             LOGGER.warning("Weights file not found: %s (running untrained)", weights_path)
         self.network.eval()
 
-        self.mcts = MCTS(network=self.network, device=self.device)
+        # GPUではTF32/FP16でTensor Coreを使い、固定入力形状向けにcuDNNのカーネル選択を有効化
+        self.use_amp = self.device.type == "cuda"
+        if self.use_amp:
+            torch.set_float32_matmul_precision("high")
+            torch.backends.cudnn.benchmark = True
+
+        if compile_network:
+            self.network = compile_for_inference(self.network, self.device, log=LOGGER.info)
+
+        # コンパイル時は葉バッチを常に batch_size 行にゼロ埋めし、推論形状を1つに固定する
+        self.mcts = MCTS(
+            network=self.network,
+            device=self.device,
+            use_amp=self.use_amp,
+            pad_batch_size=batch_size if compile_network else 0,
+        )
+        if compile_network:
+            # 初手の思考時間にコンパイルが乗らないよう、探索と同じ経路 (CUDAストリーム・形状) で事前にトレース
+            self.mcts.warmup()
         self.num_simulations = num_simulations
-
-    def _network_value(self, game: ContrastGame) -> float:
-        """Return raw network value from the current player's perspective."""
-        state = torch.from_numpy(game.encode_state()).unsqueeze(0).to(self.device)
-        self.network.eval()
-        with torch.no_grad():
-            _, _, value = self.network(state)
-        return float(value.item())
+        self.batch_size = batch_size
 
     # === Network helpers ===
     def connect(self) -> None:
@@ -262,11 +271,11 @@ class AlphaZeroBot:
             raise RuntimeError("call connect() first")
         try:
             while True:
-                chunk = self.socket.recv(4096)
+                chunk = self.socket.recv(65536)
                 if not chunk:
                     LOGGER.info("Server closed connection")
                     break
-                self.buffer += chunk.decode("utf-8", errors="ignore")
+                self.buffer += chunk
                 self.process_buffer()
         except KeyboardInterrupt:
             LOGGER.info("Interrupted by user, closing")
@@ -276,9 +285,13 @@ class AlphaZeroBot:
 
     # === Protocol parsing ===
     def process_buffer(self) -> None:
-        while "\n" in self.buffer:
-            line, self.buffer = self.buffer.split("\n", 1)
-            line = line.rstrip("\r")
+        while True:
+            nl = self.buffer.find(b"\n")
+            if nl < 0:
+                break
+            # 行単位でデコードするので、マルチバイト文字がrecv境界で分断されても問題ない
+            line = self.buffer[:nl].decode("utf-8", errors="ignore").rstrip("\r")
+            del self.buffer[: nl + 1]
             if self.collecting_state:
                 if line == "END":
                     snapshot = parse_state_block(self.state_lines)
@@ -297,9 +310,10 @@ class AlphaZeroBot:
     def handle_line(self, line: str) -> None:
         if line.startswith("INFO "):
             LOGGER.info(line)
-            match = re.search(r"You are\s+([XO])", line)
-            if match:
-                self.player_role = match.group(1)
+            if "You are" in line:
+                match = _YOU_ARE_RE.search(line)
+                if match:
+                    self.player_role = match.group(1)
         elif line.startswith("ERROR "):
             LOGGER.error(line)
             self.awaiting_response = False
@@ -329,7 +343,7 @@ class AlphaZeroBot:
             (
                 game.pieces.copy(),
                 game.tiles.copy(),
-                game.tile_counts.copy(),
+                game.get_tile_counts(),
             )
         )
 
@@ -346,20 +360,21 @@ class AlphaZeroBot:
 
     # === MCTS driver ===
     def choose_action(self, game: ContrastGame) -> Optional[int]:
-        LOGGER.info("Running MCTS (%d sims)...", self.num_simulations)
-        root_value = self._network_value(game)
-        policy, values = self.mcts.search(game, self.num_simulations)
+        LOGGER.info(
+            "Running MCTS (%d sims, batch %d)...", self.num_simulations, self.batch_size
+        )
+        policy, values = self.mcts.search_batched(
+            game, self.num_simulations, batch_size=self.batch_size
+        )
         if not policy:
             return None
+        # ルート展開時の推論結果を再利用する (別途forwardしない)
+        root_value = self.mcts.root_value
         action = max(policy, key=policy.get)
         move_value = values.get(action, 0.0)
         child_value = -move_value
 
-        move_idx, tile_idx = decode_action(action)
-        from_idx = move_idx // 25
-        to_idx = move_idx % 25
-        fx, fy = from_idx % 5, from_idx // 5
-        tx, ty = to_idx % 5, to_idx // 5
+        fx, fy, tx, ty, _, _ = decode_action_fast(action)
         LOGGER.info(
             "AI action (%s): (%d,%d)->(%d,%d) Q(parent)=%.3f, V(child)=%.3f, net_root=%.3f",
             self.player_role or "?",
@@ -374,26 +389,15 @@ class AlphaZeroBot:
         return action
 
     def send_move(self, action: int) -> None:
-        move_idx, tile_idx = decode_action(action)
-        from_idx = move_idx // 25
-        to_idx = move_idx % 25
-        fx, fy = from_idx % 5, from_idx // 5
-        tx, ty = to_idx % 5, to_idx // 5
+        fx, fy, tx, ty, tile_color, tile_pos = decode_action_fast(action)
         origin = xy_to_coord(fx, fy)
         target = xy_to_coord(tx, ty)
 
-        if tile_idx == 0:
+        if tile_color == 0:
             tile_text = "-1"
         else:
-            if tile_idx <= 25:
-                color = "b"
-                idx = tile_idx - 1
-            else:
-                color = "g"
-                idx = tile_idx - 26
-            tile_x = idx % 5
-            tile_y = idx // 5
-            tile_text = f"{xy_to_coord(tile_x, tile_y)}{color}"
+            color = "b" if tile_color == TILE_BLACK else "g"
+            tile_text = f"{xy_to_coord(tile_pos % 5, tile_pos // 5)}{color}"
 
         move_text = f"{origin},{target} {tile_text}"
         LOGGER.info("Sending move: %s", move_text)
@@ -422,6 +426,17 @@ def parse_args() -> argparse.Namespace:
         default=100,
         help="Number of MCTS simulations per move",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16,
+        help="Number of MCTS leaves evaluated per network forward pass",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the network with torch.compile before playing",
+    )
     return parser.parse_args()
 
 
@@ -436,6 +451,8 @@ def main() -> None:
         model_name=args.model,
         weights_path=args.weights,
         num_simulations=args.simulations,
+        batch_size=args.batch_size,
+        compile_network=args.compile,
     )
     bot.connect()
     bot.run()
@@ -1,9 +1,17 @@
-import copy
-from collections import deque
 from typing import List, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba未導入の環境ではPython実装のまま動かす
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
 # --- Constants for fast access ---
 # Players
 P1 = 1
@@ -16,6 +24,10 @@ TILE_BLACK = 1
 TILE_GRAY = 2
 NUM_TILES = 51  # 0(pass) + 25(black) + 25(gray) 配置する場所
 
+# 履歴の保持数 (encode_stateの入力に使う手数)
+HISTORY_LEN = 8
+_HISTORY_RANGE = np.arange(HISTORY_LEN)
+
 # Directions (Pre-computed)
 # 0: White (Orthogonal), 1: Black (Diagonal), 2: Gray (All)
 DIRS = [
@@ -28,11 +40,148 @@ DIRS = [
 ]
 
 
+def _build_decode_table() -> np.ndarray:
+    """
+    全アクションハッシュのデコード結果を一括計算する
+    Returns: (625 * 51, 6) int16 [fx, fy, tx, ty, tile_color, tile_pos]
+    tile_color は TILE_BLACK / TILE_GRAY (配置なしは 0)、tile_pos は 0~24 (配置なしは -1)
+    """
+    action = np.arange(625 * NUM_TILES)
+    move_idx = action // NUM_TILES
+    tile_idx = action % NUM_TILES
+    from_idx = move_idx // 25
+    to_idx = move_idx % 25
+
+    tile_color = np.where(
+        tile_idx == 0, 0, np.where(tile_idx <= 25, TILE_BLACK, TILE_GRAY)
+    )
+    tile_pos = np.where(
+        tile_idx == 0, -1, np.where(tile_idx <= 25, tile_idx - 1, tile_idx - 26)
+    )
+
+    return np.stack(
+        (from_idx % 5, from_idx // 5, to_idx % 5, to_idx // 5, tile_color, tile_pos),
+        axis=1,
+    ).astype(np.int16)
+
+
+_DECODE_TABLE = _build_decode_table()
+# スカラー参照用 (ndarrayの行取得よりもlistのインデックスの方が速い)
+_DECODE_ROWS = [tuple(row) for row in _DECODE_TABLE.tolist()]
+
+
+def _build_rays():
+    """
+    各マス・各方向について、スライドで通過するマスを順に並べたテーブルを作る
+    方向は DIRS[2] (Gray: 全8方向) の並び
+    Returns:
+        rays: (5, 5, 8, 4, 2) int8 [y, x, dir, step] -> (nx, ny)
+        ray_len: (5, 5, 8) int8 盤内に収まるステップ数
+    """
+    all_dirs = DIRS[2].astype(np.int64)
+    steps = np.arange(1, 5)
+    ys, xs = np.mgrid[0:5, 0:5]
+    nx = xs[:, :, None, None] + all_dirs[None, None, :, 0, None] * steps
+    ny = ys[:, :, None, None] + all_dirs[None, None, :, 1, None] * steps
+    # 直線なので盤内のマスは必ず先頭から連続する
+    in_bounds = (nx >= 0) & (nx < 5) & (ny >= 0) & (ny < 5)
+    rays = np.stack((nx, ny), axis=-1).astype(np.int8)
+    ray_len = in_bounds.sum(axis=-1).astype(np.int8)
+    return rays, ray_len
+
+
+RAYS, RAY_LEN = _build_rays()
+
+# タイル種別 -> RAYSの方向インデックス (White: 縦横, Black: 斜め, Gray: 全方向)
+TILE_DIR_INDICES = [
+    np.arange(0, 4, dtype=np.int8),
+    np.arange(4, 8, dtype=np.int8),
+    np.arange(0, 8, dtype=np.int8),
+]
+
+
+@njit(cache=True, boundscheck=False)
+def _get_valid_moves_nb(pieces, rays, ray_len, dir_indices, x, y, player):
+    """
+    移動先のスライド探索 (JIT対象)
+    事前計算したレイを先頭から走査するので、境界チェックは不要
+    Returns: (moves (8, 2) int8 [nx, ny], 有効な件数)
+    """
+    moves = np.empty((8, 2), dtype=np.int8)
+    count = 0
+    for d in dir_indices:
+        for s in range(ray_len[y, x, d]):
+            nx = rays[y, x, d, s, 0]
+            ny = rays[y, x, d, s, 1]
+            target = pieces[ny, nx]
+
+            if target == 0:
+                # Empty -> Valid Move
+                moves[count, 0] = nx
+                moves[count, 1] = ny
+                count += 1
+                break  # Stop sliding
+            elif target != player:
+                # Enemy -> Blocked
+                break
+            # Friend -> Jump over
+
+    return moves, count
+
+
+@njit(cache=True, boundscheck=False)
+def _check_win_nb(pieces):
+    """
+    勝者判定 (JIT対象): P1が最上段(y=0)、P2が最下段(y=4)に到達したら勝ち
+    Returns: 勝者 (P1 / P2)、未決着なら 0
+    """
+    for x in range(5):
+        if pieces[0, x] == P1:
+            return P1
+    for x in range(5):
+        if pieces[4, x] == P2:
+            return P2
+    return 0
+
+
+def _build_zobrist_tables():
+    """
+    Zobristハッシュ用の乱数テーブル (シード固定なのでプロセス間で同じ値になる)
+    Returns:
+        pieces: (3, 25) uint64 [駒, マス] (空きマスは0)
+        tiles: (3, 25) uint64 [タイル, マス] (白タイルは0)
+        counts: (4, 4) uint64 [持ちタイルの種類 (P1黒, P1グレー, P2黒, P2グレー), 枚数]
+        player: (3,) uint64 [手番]
+    """
+    rng = np.random.default_rng(0x5EED)
+    bits = lambda shape: rng.integers(0, 2**64, size=shape, dtype=np.uint64)
+    pieces = bits((3, 25))
+    pieces[0] = 0
+    tiles = bits((3, 25))
+    tiles[TILE_WHITE] = 0
+    return pieces, tiles, bits((4, 4)), bits(3)
+
+
+_ZOBRIST_PIECES, _ZOBRIST_TILES, _ZOBRIST_COUNTS, _ZOBRIST_PLAYER = _build_zobrist_tables()
+_CELLS = np.arange(25)
+
+# 合法手がない場合の返り値 (共有するので書き換えないこと)
+_NO_ACTIONS = np.empty(0, dtype=np.int32)
+_NO_ACTIONS.flags.writeable = False
+
+
+# import時にコンパイルしておき、MCTSの初回呼び出しで待たされないようにする
+_get_valid_moves_nb(
+    np.zeros((5, 5), dtype=np.int8), RAYS, RAY_LEN, TILE_DIR_INDICES[2], 0, 0, P1
+)
+_check_win_nb(np.zeros((5, 5), dtype=np.int8))
+
+
 class ContrastGame:
     ACTION_SIZE_TILE = NUM_TILES
     
     def __str__(self):
-        return f"ContrastGame(player={self.current_player}, pieces=\n{self.pieces},\ntiles=\n{self.tiles}, tile_counts={self.tile_counts})"
+        return f"ContrastGame(player={self.current_player}, pieces=\n{self.pieces},\ntiles=\n{self.tiles}, tile_counts={self.get_tile_counts()})"
 
     def __init__(self, board_size: int = 5):
         self.size = board_size
@@ -43,10 +192,9 @@ class ContrastGame:
         self.pieces = np.zeros((self.size, self.size), dtype=np.int8)
         self.tiles = np.zeros((self.size, self.size), dtype=np.int8)
 
-        # 持ちタイル数 [Player-1][TileType] (Player index is 0 or 1 for array access)
-        # index 0: P1, index 1: P2
-        # index 0: Black, index 1: Gray
-        self.tile_counts = np.array([[3, 1], [3, 1]], dtype=np.int8)
+        # 持ちタイル数 (NumPyのスカラーアクセスを避けるためPythonのintで保持)
+        # tc_p1_b: P1の黒, tc_p1_g: P1のグレー, tc_p2_b: P2の黒, tc_p2_g: P2のグレー
+        self.tc_p1_b, self.tc_p1_g, self.tc_p2_b, self.tc_p2_g = 3, 1, 3, 1
 
         self.current_player = P1
         self.game_over = False
@@ -54,8 +202,26 @@ class ContrastGame:
         self.move_count = 0
 
         # 履歴管理 (8手分)
-        # 高速化のため、dictではなくtuple(pieces, tiles, tile_counts)を保存
-        self.history = deque(maxlen=8)
+        # 高速化のため、事前確保したリングバッファに上書きしていく
+        # _hist_head が最新、(_hist_head + i) % 8 が i手前の状態
+        self._hist_pieces = np.zeros((HISTORY_LEN, self.size, self.size), dtype=np.int8)
+        self._hist_tiles = np.zeros((HISTORY_LEN, self.size, self.size), dtype=np.int8)
+        # 持ちタイル数は get_tile_counts() と同じ (P1黒, P1グレー, P2黒, P2グレー) の順
+        self._hist_counts = np.zeros((HISTORY_LEN, 4), dtype=np.int8)
+        self._hist_head = 0
+        self._hist_len = 0
+
+        # encode_stateの出力バッファ (初回呼び出し時に確保して使い回す)
+        self._encode_buf = None
+
+        # 駒・白タイルの位置集合 (y * 5 + x)。np.whereでの盤面走査を避けるため差分更新する
+        self._p1_positions = set()
+        self._p2_positions = set()
+        self._white_positions = set()
+
+        # state_key() / zobrist() のキャッシュ (stepで無効化)
+        self._state_key = None
+        self._zobrist = None
 
         self.setup_initial_position()
 
@@ -66,142 +232,214 @@ class ContrastGame:
         self.pieces[4, :] = P1
         self.pieces[0, :] = P2
 
-        self.tile_counts = np.array([[3, 1], [3, 1]], dtype=np.int8)
+        self.tc_p1_b, self.tc_p1_g, self.tc_p2_b, self.tc_p2_g = 3, 1, 3, 1
         self.current_player = P1
         self.move_count = 0
         self.game_over = False
         self.winner = 0
 
-        self.history.clear()
+        self.sync_positions()
+        self.clear_history()
         self._save_history()
 
+    def get_tile_counts(self) -> Tuple[int, int, int, int]:
+        """持ちタイル数 (P1黒, P1グレー, P2黒, P2グレー)"""
+        return self.tc_p1_b, self.tc_p1_g, self.tc_p2_b, self.tc_p2_g
+
+    def tile_counts_of(self, player: int) -> Tuple[int, int]:
+        """指定プレイヤーの持ちタイル数 (黒, グレー)"""
+        if player == P1:
+            return self.tc_p1_b, self.tc_p1_g
+        return self.tc_p2_b, self.tc_p2_g
+
+    def sync_positions(self):
+        """pieces / tiles などを直接書き換えた後に位置集合とキーのキャッシュを作り直す"""
+        self._state_key = None
+        self._zobrist = None
+        flat_pieces = self.pieces.ravel()
+        self._p1_positions = set(np.flatnonzero(flat_pieces == P1).tolist())
+        self._p2_positions = set(np.flatnonzero(flat_pieces == P2).tolist())
+        self._white_positions = set(np.flatnonzero(self.tiles.ravel() == TILE_WHITE).tolist())
+
+    def state_key(self):
+        """
+        状態を一意に識別するハッシュ可能なキー (MCTSのノードの識別に使う)
+        (pieces_bytes, tiles_bytes, 持ちタイル数 x4・手番・手数を1つに詰めたint)
+        持ちタイル数は各4bit、手番は2bit、その上位に手数
+        """
+        key = self._state_key
+        if key is None:
+            key = (
+                self.pieces.tobytes(),
+                self.tiles.tobytes(),
+                self.tc_p1_b
+                | self.tc_p1_g << 4
+                | self.tc_p2_b << 8
+                | self.tc_p2_g << 12
+                | self.current_player << 16
+                | self.move_count << 18,
+            )
+            self._state_key = key
+        return key
+
+    def zobrist(self) -> int:
+        """
+        盤面・持ちタイル数・手番のZobristハッシュ (64bit int)
+        state_keyと違い手数と履歴を含まないので、手順違いで合流した同じ局面は同じ値になる
+        """
+        h = self._zobrist
+        if h is None:
+            h = (
+                np.bitwise_xor.reduce(_ZOBRIST_PIECES[self.pieces.ravel(), _CELLS])
+                ^ np.bitwise_xor.reduce(_ZOBRIST_TILES[self.tiles.ravel(), _CELLS])
+                ^ _ZOBRIST_COUNTS[0, self.tc_p1_b]
+                ^ _ZOBRIST_COUNTS[1, self.tc_p1_g]
+                ^ _ZOBRIST_COUNTS[2, self.tc_p2_b]
+                ^ _ZOBRIST_COUNTS[3, self.tc_p2_g]
+                ^ _ZOBRIST_PLAYER[self.current_player]
+            )
+            h = int(h)
+            self._zobrist = h
+        return h
+
+    def clear_history(self):
+        """履歴を空にする"""
+        self._hist_head = 0
+        self._hist_len = 0
+
+    def push_history(self, pieces, tiles, tile_counts):
+        """指定した状態を最新の履歴として追加 (バッファへコピー)"""
+        self._hist_head = (self._hist_head - 1) % HISTORY_LEN
+        np.copyto(self._hist_pieces[self._hist_head], pieces)
+        np.copyto(self._hist_tiles[self._hist_head], tiles)
+        self._hist_counts[self._hist_head] = tile_counts
+        self._hist_len = min(self._hist_len + 1, HISTORY_LEN)
+
     def _save_history(self):
-        """現在の状態を履歴に追加 (コピーを作成)"""
-        self.history.appendleft(
-            (self.pieces.copy(), self.tiles.copy(), self.tile_counts.copy())
-        )
+        """現在の状態を履歴に追加"""
+        self.push_history(self.pieces, self.tiles, self.get_tile_counts())
 
     def copy(self):
         """シミュレーション用の軽量コピー"""
-        new_game = ContrastGame(self.size)
+        # __init__ (初期配置・バッファ確保) を通さずに生成し、各配列を1回ずつコピーする
+        new_game = ContrastGame.__new__(ContrastGame)
+        new_game.size = self.size
         new_game.pieces = self.pieces.copy()
         new_game.tiles = self.tiles.copy()
-        new_game.tile_counts = self.tile_counts.copy()
+        new_game.tc_p1_b = self.tc_p1_b
+        new_game.tc_p1_g = self.tc_p1_g
+        new_game.tc_p2_b = self.tc_p2_b
+        new_game.tc_p2_g = self.tc_p2_g
         new_game.current_player = self.current_player
         new_game.game_over = self.game_over
         new_game.winner = self.winner
         new_game.move_count = self.move_count
-        # historyは重いので、必要ならコピーするが、
-        # MCTSのSimulation内だけで完結するなら直近の状態だけで良い場合も多い。
-        # ここでは正確性のため浅くコピーしておく
-        new_game.history = copy.copy(self.history)
+        new_game._p1_positions = self._p1_positions.copy()
+        new_game._p2_positions = self._p2_positions.copy()
+        new_game._white_positions = self._white_positions.copy()
+        new_game._state_key = self._state_key
+        new_game._zobrist = self._zobrist
+        # 履歴はリングバッファごと一括コピー
+        new_game._hist_pieces = self._hist_pieces.copy()
+        new_game._hist_tiles = self._hist_tiles.copy()
+        new_game._hist_counts = self._hist_counts.copy()
+        new_game._hist_head = self._hist_head
+        new_game._hist_len = self._hist_len
+        # 出力バッファは共有せず、必要になった時点で確保する
+        new_game._encode_buf = None
         return new_game
 
     def get_valid_moves(self, x: int, y: int) -> List[Tuple[int, int]]:
         """
-        Numpy最適化された移動先生成
+        Numba最適化された移動先生成
         """
         # 自分の駒でなければ移動不可
         if self.pieces[y, x] != self.current_player:
             return []
 
-        moves = []
-        tile_type = self.tiles[y, x]
-        directions = DIRS[tile_type]
-
-        # Python loop is faster than numpy checking for small fixed steps
-        # But we can use direct array access
-        p_arr = self.pieces
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-
-            # Bounds check loop
-            while 0 <= nx < 5 and 0 <= ny < 5:
-                target = p_arr[ny, nx]
-
-                if target == 0:
-                    # Empty -> Valid Move
-                    moves.append((nx, ny))
-                    break  # Stop sliding
-                elif target == self.current_player:
-                    # Friend -> Jump over
-                    nx += dx
-                    ny += dy
-                    continue
-                else:
-                    # Enemy -> Blocked
-                    break
-
-        return moves
+        moves, count = _get_valid_moves_nb(
+            self.pieces,
+            RAYS,
+            RAY_LEN,
+            TILE_DIR_INDICES[self.tiles[y, x]],
+            x,
+            y,
+            self.current_player,
+        )
+        return [(int(moves[i, 0]), int(moves[i, 1])) for i in range(count)]
 
     def get_all_legal_actions(self) -> List[int]:
         """
         全合法手のハッシュ(int)のリストを返す。
         """
-        if self.game_over:
-            return []
-
-        legal_hashes = []  # intのリスト
-
-        # 1. 自分の駒の位置
-        py, px = np.where(self.pieces == self.current_player)
+        return self.legal_actions_array().tolist()
 
-        # 2. 持ちタイル情報
-        p_idx = self.current_player - 1
-        has_black = self.tile_counts[p_idx, 0] > 0
-        has_gray = self.tile_counts[p_idx, 1] > 0
-
-        # 3. 白タイルの場所 (配置候補)
-        # 事前に座標リスト化しておく
-        white_ty, white_tx = np.where(self.tiles == TILE_WHITE)
-        white_spots = list(zip(white_tx, white_ty))
-
-        # 定数のローカル変数化 (ループ内アクセス高速化)
-        SIZE_TILE = self.ACTION_SIZE_TILE
-        pieces = self.pieces  # numpy array access
-
-        for i in range(len(px)):
-            cx, cy = px[i], py[i]
-
-            # 移動先取得
-            moves = self.get_valid_moves(cx, cy)
-
-            for mx, my in moves:
-                # Base Move Index (0~624)
-                move_idx = (cy * 5 + cx) * 25 + (my * 5 + mx)
-
-                # Base Hash (move_idx * 51)
-                base_hash = move_idx * SIZE_TILE
-
-                # A. Move Only (Tile=0) -> base_hash + 0
-                legal_hashes.append(base_hash)
-
-                if not (has_black or has_gray):
-                    continue
-
-                # B. Move + Place Tile
-                for tx, ty in white_spots:
-                    # 移動先には置けない
-                    if tx == mx and ty == my:
-                        continue
-
-                    # 既存のコマチェック (移動元のコマは無視してOK)
-                    if pieces[ty, tx] != 0 and not (tx == cx and ty == cy):
-                        continue
-
-                    # Note: ここで append(int) を行うのは append(tuple) より高速です
-                    if has_black:
-                        # Tile Idx: 1 + (ty*5 + tx)
-                        t_idx = 1 + (ty * 5 + tx)
-                        legal_hashes.append(base_hash + t_idx)
+    def legal_actions_array(self) -> np.ndarray:
+        """
+        全合法手のハッシュを (A,) int32 の配列で返す (並びは get_all_legal_actions と同じ)
+        """
+        if self.game_over:
+            return _NO_ACTIONS
+
+        # 1. 自分の駒の位置 (盤面の走査順 = y * 5 + x の昇順)
+        my_positions = self._p1_positions if self.current_player == P1 else self._p2_positions
+
+        # 2. 移動 (from_idx, to_idx) を列挙
+        from_list = []
+        to_list = []
+        for from_idx in sorted(my_positions):
+            cy, cx = divmod(from_idx, 5)
+            for mx, my in self.get_valid_moves(cx, cy):
+                from_list.append(from_idx)
+                to_list.append(my * 5 + mx)
+
+        if not from_list:
+            return _NO_ACTIONS
+
+        from_arr = np.array(from_list, dtype=np.int32)
+        to_arr = np.array(to_list, dtype=np.int32)
+        # Base Hash (move_idx * 51)
+        base_hash = (from_arr * 25 + to_arr) * self.ACTION_SIZE_TILE
+
+        # 3. 持ちタイル情報 -> タイルIdxのオフセット (黒: 1+pos, グレー: 26+pos)
+        black, gray = self.tile_counts_of(self.current_player)
+        offsets = []
+        if black > 0:
+            offsets.append(1)
+        if gray > 0:
+            offsets.append(26)
+
+        if not offsets:
+            # A. Move Only (Tile=0)
+            return base_hash
+
+        # 4. 白タイルの場所 (配置候補)
+        white_idx = np.array(sorted(self._white_positions), dtype=np.int32)
+        occupied = self.pieces.ravel()[white_idx] != 0
+
+        # 列: [Tile=0, spot0+黒, spot0+グレー, spot1+黒, ...] (従来の列挙順と同じ)
+        tile_idx = np.concatenate(
+            (
+                np.zeros(1, dtype=np.int32),
+                (white_idx[:, None] + np.array(offsets, dtype=np.int32)).ravel(),
+            )
+        )
 
-                    if has_gray:
-                        # Tile Idx: 26 + (ty*5 + tx)
-                        t_idx = 26 + (ty * 5 + tx)
-                        legal_hashes.append(base_hash + t_idx)
+        # B. Move + Place Tile の有効マスク (n_moves, n_white)
+        # 移動先には置けない / 既存のコマがある場所には置けない (移動元のコマは無視してOK)
+        spot_ok = (white_idx[None, :] != to_arr[:, None]) & (
+            ~occupied[None, :] | (white_idx[None, :] == from_arr[:, None])
+        )
+        mask = np.concatenate(
+            (
+                np.ones((len(from_arr), 1), dtype=bool),
+                np.repeat(spot_ok, len(offsets), axis=1),
+            ),
+            axis=1,
+        )
 
-        return legal_hashes
+        hashes = base_hash[:, None] + tile_idx[None, :]
+        return hashes[mask]
 
     # --- Step & Update ---
 
@@ -209,43 +447,32 @@ class ContrastGame:
         """
         ハッシュ化されたアクションを受け取って状態を更新
         """
-        # デコード処理 (高速な整数演算のみ)
-        move_idx = action_hash // self.ACTION_SIZE_TILE
-        tile_idx = action_hash % self.ACTION_SIZE_TILE
-
-        # Parse Move
-        from_idx = move_idx // 25
-        to_idx = move_idx % 25
-        fx, fy = from_idx % 5, from_idx // 5
-        tx, ty = to_idx % 5, to_idx // 5
-
-        # Parse Tile
-        place_tile = False
-        t_color = 0
-        t_x, t_y = 0, 0
-
-        if tile_idx > 0:
-            place_tile = True
-            if tile_idx <= 25:
-                # Black
-                t_color = TILE_BLACK
-                idx = tile_idx - 1
-            else:
-                # Gray
-                t_color = TILE_GRAY
-                idx = tile_idx - 26
-
-            t_x, t_y = idx % 5, idx // 5
+        # デコード処理 (事前計算したテーブルを参照)
+        fx, fy, tx, ty, t_color, t_pos = _DECODE_ROWS[action_hash]
+        self._state_key = None
+        self._zobrist = None
 
         # --- Execute Move (In-place) ---
         self.pieces[ty, tx] = self.pieces[fy, fx]
         self.pieces[fy, fx] = 0
 
-        if place_tile:
-            self.tiles[t_y, t_x] = t_color
-            p_idx = self.current_player - 1
-            c_idx = 0 if t_color == TILE_BLACK else 1
-            self.tile_counts[p_idx, c_idx] -= 1
+        # 駒を取るルールはないので、手番側の位置を移し替えるだけ
+        my_positions = self._p1_positions if self.current_player == P1 else self._p2_positions
+        my_positions.discard(fy * 5 + fx)
+        my_positions.add(ty * 5 + tx)
+
+        if t_color:
+            self.tiles[t_pos // 5, t_pos % 5] = t_color
+            self._white_positions.discard(t_pos)
+            if self.current_player == P1:
+                if t_color == TILE_BLACK:
+                    self.tc_p1_b -= 1
+                else:
+                    self.tc_p1_g -= 1
+            elif t_color == TILE_BLACK:
+                self.tc_p2_b -= 1
+            else:
+                self.tc_p2_g -= 1
 
         self._check_win_fast()
 
@@ -257,13 +484,11 @@ class ContrastGame:
         return self.game_over, self.winner
 
     def _check_win_fast(self):
-        # Numpy check is fast
-        if np.any(self.pieces[0, :] == P1):
+        # 5要素の走査はNumPyの呼び出しコストが支配的なのでJITカーネルで判定
+        winner = _check_win_nb(self.pieces)
+        if winner:
             self.game_over = True
-            self.winner = P1
-        elif np.any(self.pieces[4, :] == P2):
-            self.game_over = True
-            self.winner = P2
+            self.winner = winner
 
     # --- Encoding ---
 
@@ -271,44 +496,47 @@ class ContrastGame:
         """
         (90, 5, 5) の入力テンソルを生成
         P2の場合は盤面を180度回転させ、P1視点に正規化する
+        返り値はこのインスタンスの内部バッファなので、次の呼び出し後も保持する場合はコピーすること
         """
-        input_tensor = np.zeros((90, 5, 5), dtype=np.float32)
+        # 32~55は常に0、それ以外は毎回すべて上書きするので再ゼロ埋めは不要
+        input_tensor = self._encode_buf
+        if input_tensor is None:
+            input_tensor = np.zeros((90, 5, 5), dtype=np.float32)
+            self._encode_buf = input_tensor
 
-        # 履歴取得 (足りない分はパディング)
-        hist_len = len(self.history)
+        # 履歴取得 (新しい順、足りない分は最古の履歴でパディング)
+        hist_idx = (
+            self._hist_head + np.minimum(_HISTORY_RANGE, self._hist_len - 1)
+        ) % HISTORY_LEN
 
         current_pid = self.current_player
         opp_pid = OPPONENT[current_pid]
 
-        # Player Index for tile counts
-        my_idx = current_pid - 1
-        opp_idx = opp_pid - 1
-
-        # 【追加】P2なら盤面を回転させるフラグ
-        should_flip = current_pid == P2
+        # 持ちタイル数の列 (黒: 2 * (player - 1), グレー: 黒 + 1)
+        my_col = 2 * (current_pid - 1)
+        opp_col = 2 * (opp_pid - 1)
 
-        for i in range(8):
-            if i < hist_len:
-                p_grid, t_grid, t_counts = self.history[i]
-            else:
-                p_grid, t_grid, t_counts = self.history[-1]
+        # (8, 5, 5), (8, 5, 5), (8, 4)
+        p_grid = self._hist_pieces[hist_idx]
+        t_grid = self._hist_tiles[hist_idx]
+        t_counts = self._hist_counts[hist_idx]
 
-            # 【追加】P2視点なら盤面を180度回転
-            if should_flip:
-                p_grid = np.rot90(p_grid, 2)
-                t_grid = np.rot90(t_grid, 2)
+        # 【追加】P2視点なら盤面を180度回転 (8枚まとめて、コピーなしのview)
+        if current_pid == P2:
+            p_grid = p_grid[:, ::-1, ::-1]
+            t_grid = t_grid[:, ::-1, ::-1]
 
-            # Plane offsets
-            input_tensor[i] = p_grid == current_pid
-            input_tensor[8 + i] = p_grid == opp_pid
-            input_tensor[16 + i] = t_grid == TILE_BLACK
-            input_tensor[24 + i] = t_grid == TILE_GRAY
+        # Plane offsets (比較結果を出力バッファへ直接書き込み、中間のbool配列を作らない)
+        np.equal(p_grid, current_pid, out=input_tensor[0:8])
+        np.equal(p_grid, opp_pid, out=input_tensor[8:16])
+        np.equal(t_grid, TILE_BLACK, out=input_tensor[16:24])
+        np.equal(t_grid, TILE_GRAY, out=input_tensor[24:32])
 
-            # Tile Counts (値は回転不要、埋めるだけ)
-            input_tensor[56 + i].fill(t_counts[my_idx, 0] / 3.0)
-            input_tensor[64 + i].fill(t_counts[my_idx, 1] / 1.0)
-            input_tensor[72 + i].fill(t_counts[opp_idx, 0] / 3.0)
-            input_tensor[80 + i].fill(t_counts[opp_idx, 1] / 1.0)
+        # Tile Counts (値は回転不要、埋めるだけ)
+        input_tensor[56:64] = (t_counts[:, my_col] / 3.0)[:, None, None]
+        input_tensor[64:72] = (t_counts[:, my_col + 1] / 1.0)[:, None, None]
+        input_tensor[72:80] = (t_counts[:, opp_col] / 3.0)[:, None, None]
+        input_tensor[80:88] = (t_counts[:, opp_col + 1] / 1.0)[:, None, None]
 
         # 88: Color (P2の場合は回転しているので、常にP1視点として扱えるため常に1でも良いが、
         # AlphaZeroの慣例的には手番プレーヤーIDを入れることもある。
@@ -338,34 +566,53 @@ def decode_action(action_hash: int) -> Tuple[int, int]:
     return move_idx, tile_idx
 
 
+def decode_action_fast(action_hash: int) -> Tuple[int, int, int, int, int, int]:
+    """
+    unique hash (int) -> (fx, fy, tx, ty, tile_color, tile_pos)
+    tile_color: TILE_BLACK / TILE_GRAY (配置なしは 0), tile_pos: 0~24 (配置なしは -1)
+    """
+    return _DECODE_ROWS[action_hash]
+
+
 def flip_location(idx: int) -> int:
     """盤面インデックス(0-24)を180度回転させる: i -> 24-i"""
     return 24 - idx
 
 
-def flip_action(action_hash: int) -> int:
-    """アクションハッシュを180度回転した視点に変換する"""
-    move_idx = action_hash // NUM_TILES
-    tile_idx = action_hash % NUM_TILES
+def _build_flip_table() -> np.ndarray:
+    """
+    全アクションハッシュを180度回転した視点のハッシュに変換する表を作る
+    Returns: (625 * 51,) int32
+    """
+    action = np.arange(625 * NUM_TILES)
+    move_idx = action // NUM_TILES
+    tile_idx = action % NUM_TILES
 
     # Moveの変換
-    from_idx = move_idx // 25
-    to_idx = move_idx % 25
-
-    new_from = flip_location(from_idx)
-    new_to = flip_location(to_idx)
+    new_from = 24 - move_idx // 25
+    new_to = 24 - move_idx % 25
     new_move_idx = new_from * 25 + new_to
 
-    # Tileの変換
-    new_tile_idx = 0
-    if tile_idx > 0:
-        if tile_idx <= 25:  # Black
-            pos = tile_idx - 1
-            new_pos = flip_location(pos)
-            new_tile_idx = new_pos + 1
-        else:  # Gray
-            pos = tile_idx - 26
-            new_pos = flip_location(pos)
-            new_tile_idx = new_pos + 26
-
-    return new_move_idx * NUM_TILES + new_tile_idx
+    # Tileの変換 (Black: 1~25, Gray: 26~50 の中で位置だけ反転)
+    new_tile_idx = np.where(
+        tile_idx == 0,
+        0,
+        np.where(tile_idx <= 25, (24 - (tile_idx - 1)) + 1, (24 - (tile_idx - 26)) + 26),
+    )
+
+    return (new_move_idx * NUM_TILES + new_tile_idx).astype(np.int32)
+
+
+_FLIP_ACTION = _build_flip_table()
+# スカラー参照用 (ndarrayの要素取得よりもlistのインデックスの方が速い)
+_FLIP_ACTION_LIST = _FLIP_ACTION.tolist()
+
+
+def flip_action(action_hash: int) -> int:
+    """アクションハッシュを180度回転した視点に変換する"""
+    return _FLIP_ACTION_LIST[action_hash]
+
+
+def flip_actions(action_hashes: np.ndarray) -> np.ndarray:
+    """flip_action の配列版 (任意形状のハッシュ配列をまとめて変換)"""
+    return _FLIP_ACTION[action_hashes]
@@ -1,8 +1,9 @@
+import asyncio
 import datetime
 import logging
 import os
-import random
-from collections import deque
+import threading
+import time
 from dataclasses import dataclass
 
 import numpy as np
@@ -15,7 +16,7 @@ from tqdm import tqdm
 from contrast_game import ContrastGame
 from logger import get_logger, setup_logger
 from mcts import MCTS
-from model import ContrastDualPolicyNet
+from model import ContrastDualPolicyNet, fuse_conv_bn
 
 logger = get_logger(__name__)
 
@@ -24,142 +25,433 @@ NUM_CPUS = os.cpu_count()
 NUM_GPUS = 1 if torch.cuda.is_available() else 0
 BATCH_SIZE = 128
 BUFFER_SIZE = 40000
+MIN_REPLAY_SIZE = 2000  # 学習を始めるのに必要なバッファ内のサンプル数 (序盤の少数のゲームに過学習しないように)
+SAMPLES_PER_TRAIN_STEP = 16  # 学習1ステップごとに必要な新規サンプル数 (データ量に対する学習量の上限)
 LEARNING_RATE = 0.001
 WEIGHT_DECAY = 1e-4
 MAX_STEPS = 150  # ★追加: これ以上長引いたら強制終了
+MCTS_BATCH_SIZE = 16  # Self-playのMCTSで1回の推論にまとめる葉の数
+INFERENCE_MAX_BATCH = 256  # InferenceServerが1回のforwardにまとめる最大の状態数
+INFERENCE_WAIT_MS = 2  # InferenceServerが要求を溜める最大待ち時間
+INFERENCE_NUM_THREADS = 4  # InferenceServerのintra-opスレッド数 (CPU推論時にconvを並列化する)
+VALUE_CACHE_SIZE = 20000  # Self-playのMCTSで盤面ごとの推論結果を使い回す件数 (LRU)
 
 
 @dataclass
 class Sample:
-    state: np.ndarray  # (90, 5, 5)
-    mcts_policy: dict  # {action_hash: prob}
+    state: np.ndarray  # (PACKED_STATE_SIZE,) uint8 (pack_stateで詰めたもの)
+    policy_idx: np.ndarray  # (A,) int32 MCTSの分布のaction_hash
+    policy_p: np.ndarray  # (A,) float16 policy_idxに対応する確率
     player: int  # 1 or 2
     reward: float = 0.0  # 後で埋める
 
 
+# encode_stateのプレーン構成
+# 0~55: 0/1 の2値プレーン (32~55は常に0) -> ビット単位で詰める
+# 56~89: 盤面全体で一定値のプレーン (持ちタイル数・手番・手数) -> 1プレーン1バイト
+N_BINARY_PLANES = 56
+N_SCALAR_PLANES = 90 - N_BINARY_PLANES
+N_PACKED_BYTES = N_BINARY_PLANES * 25 // 8  # 1400 bit = 175 byte
+PACKED_STATE_SIZE = N_PACKED_BYTES + N_SCALAR_PLANES  # 209 byte (float32だと9000 byte)
+
+
+def _build_scalar_scale() -> np.ndarray:
+    """
+    一定値プレーン (56~89) を整数に戻す倍率 (34,)
+    持ちタイル数(黒)は /3、手数は /100 で正規化されており、それ以外は整数
+    """
+    scale = np.ones(N_SCALAR_PLANES, dtype=np.float32)
+    scale[56 - N_BINARY_PLANES:64 - N_BINARY_PLANES] = 3.0  # 自分の黒タイル数 / 3
+    scale[72 - N_BINARY_PLANES:80 - N_BINARY_PLANES] = 3.0  # 相手の黒タイル数 / 3
+    scale[89 - N_BINARY_PLANES] = 100.0  # move_count / 100
+    return scale
+
+
+# 一定値プレーンはuint8で保持する (MAX_STEPS <= 255 なので手数も収まる)
+SCALAR_SCALE = _build_scalar_scale()
+_SCALAR_SCALE_T = torch.from_numpy(SCALAR_SCALE)
+# packbitsはMSBから詰めるので、展開時も上位ビットから取り出す
+_BIT_SHIFTS_T = torch.arange(7, -1, -1, dtype=torch.uint8)
+
+
+def pack_state(state: np.ndarray) -> np.ndarray:
+    """encode_stateの出力 (90, 5, 5) を (PACKED_STATE_SIZE,) のuint8に詰める"""
+    packed = np.empty(PACKED_STATE_SIZE, dtype=np.uint8)
+    packed[:N_PACKED_BYTES] = np.packbits(state[:N_BINARY_PLANES].astype(np.uint8))
+    packed[N_PACKED_BYTES:] = np.rint(state[N_BINARY_PLANES:, 0, 0] * SCALAR_SCALE)
+    return packed
+
+
+def unpack_states(packed: torch.Tensor) -> torch.Tensor:
+    """pack_stateで詰めた (B, PACKED_STATE_SIZE) を、同じdevice上で (B, 90, 5, 5) float32に戻す"""
+    b = packed.shape[0]
+    device = packed.device
+    bits = (packed[:, :N_PACKED_BYTES, None] >> _BIT_SHIFTS_T.to(device)) & 1
+    binary = bits.reshape(b, N_BINARY_PLANES, 5, 5).float()
+    scalars = packed[:, N_PACKED_BYTES:].float() / _SCALAR_SCALE_T.to(device)
+    return torch.cat([binary, scalars[:, :, None, None].expand(-1, -1, 5, 5)], dim=1)
+
+
+def amp_dtype_for(device):
+    """GPUでの混合精度の型 (BF16が使えればBF16、なければFP16)"""
+    if device.type == "cuda" and torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return torch.float16
+
+
 class ReplayBuffer:
+    """
+    事前確保した連続テンソルのリングバッファ
+    states: (N, PACKED_STATE_SIZE) uint8 (pack_stateで詰めた状態)
+    move_targets / tile_targets: (N, 625) / (N, 51) float16 (周辺化済みのPolicy)
+    values: (N,) float32
+    """
+
     def __init__(self, buffer_size):
-        self.buffer = deque(maxlen=buffer_size)
+        self.capacity = buffer_size
+        self.states = torch.empty((buffer_size, PACKED_STATE_SIZE), dtype=torch.uint8)
+        self.move_targets = torch.zeros((buffer_size, 625), dtype=torch.float16)
+        self.tile_targets = torch.zeros((buffer_size, 51), dtype=torch.float16)
+        self.values = torch.empty(buffer_size, dtype=torch.float32)
+        self.write_ptr = 0
+        self.size = 0
+        # これまでに追加したサンプルの総数 (上書きされた分も含む)
+        self.total_added = 0
+
+        # GPU転送用のpinnedステージングバッファ (ミニバッチのサイズで確保して使い回す)
+        self._staging = None
+        # 直前のステージングバッファからの転送完了を表すイベント
+        self._staging_event = None
 
     def add_record(self, record):
-        self.buffer.extend(record)
+        """1ゲーム分のSampleを書き込む (古いものから上書き)"""
+        n = min(len(record), self.capacity)
+        if n == 0:
+            return
+        record = record[-n:]
+
+        states = np.stack([sample.state for sample in record])
+        value_targets = np.array([sample.reward for sample in record], dtype=np.float32)
+
+        # --- MCTSのSparseなPolicyをDual HeadのDenseなTargetに変換 ---
+        # Move Target: (n, 625), Tile Target: (n, 51)
+        # 全サンプルの (hash, prob) を連結し、行番号付きで一括加算 (周辺化)
+        # 確率はfloat16で保持しているので、加算の前にfloat32へ戻す
+        hashes = np.concatenate([sample.policy_idx for sample in record])
+        probs = np.concatenate([sample.policy_p for sample in record]).astype(np.float32)
+        rows = np.repeat(np.arange(n), [sample.policy_idx.size for sample in record])
+
+        move_targets = np.zeros((n, 625), dtype=np.float32)
+        tile_targets = np.zeros((n, 51), dtype=np.float32)
+        np.add.at(move_targets, (rows, hashes // 51), probs)
+        np.add.at(tile_targets, (rows, hashes % 51), probs)
+
+        idx = torch.from_numpy((self.write_ptr + np.arange(n)) % self.capacity)
+        self.states[idx] = torch.from_numpy(states)
+        self.move_targets[idx] = torch.from_numpy(move_targets).half()
+        self.tile_targets[idx] = torch.from_numpy(tile_targets).half()
+        self.values[idx] = torch.from_numpy(value_targets)
+
+        self.write_ptr = (self.write_ptr + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        self.total_added += n
 
     def __len__(self):
-        return len(self.buffer)
+        return self.size
 
-    def get_minibatch(self, batch_size):
+    def get_minibatch(self, batch_size, device=torch.device("cpu")):
         """
-        バッチを取り出し、PyTorchのTensor形式（Dual Head用ターゲット）に変換して返す
+        バッチを取り出し、PyTorchのTensor形式（Dual Head用ターゲット）でdeviceに載せて返す
+        詰めた状態 / float16 のままGPUへnon_blockingで転送し、転送先で展開してfloat32に戻す
         """
-        batch = random.sample(self.buffer, min(len(self.buffer), batch_size))
+        idx = torch.randint(0, self.size, (batch_size,))
+        sources = (self.states, self.move_targets, self.tile_targets, self.values)
 
-        states = []
-        move_targets = []
-        tile_targets = []
-        value_targets = []
+        if device.type == "cuda":
+            tensors = self._stage(sources, idx)
+        else:
+            tensors = tuple(src[idx] for src in sources)
+        states, move_targets, tile_targets, values = (
+            t.to(device, non_blocking=True) for t in tensors
+        )
+        if device.type == "cuda":
+            self._staging_event = torch.cuda.Event()
+            self._staging_event.record()
 
-        for sample in batch:
-            states.append(sample.state)
-            value_targets.append(sample.reward)
+        return (
+            unpack_states(states),
+            move_targets.float(),
+            tile_targets.float(),
+            values.unsqueeze(1),
+        )
+
+    def _stage(self, sources, idx):
+        """ミニバッチをpinnedステージングバッファへ直接gatherする"""
+        n = idx.shape[0]
+        if self._staging is None or self._staging[0].shape[0] != n:
+            self._staging = tuple(
+                torch.empty((n,) + src.shape[1:], dtype=src.dtype, pin_memory=True)
+                for src in sources
+            )
+        elif self._staging_event is not None:
+            # 前回の非同期転送が読み終わるまでバッファを上書きしない
+            self._staging_event.synchronize()
 
-            # --- MCTSのSparseなPolicyをDual HeadのDenseなTargetに変換 ---
-            # Move Target: (625,), Tile Target: (51,)
-            m_target = np.zeros(625, dtype=np.float32)
-            t_target = np.zeros(51, dtype=np.float32)
+        for src, dst in zip(sources, self._staging):
+            torch.index_select(src, 0, idx, out=dst)
+        return self._staging
 
-            for action_hash, prob in sample.mcts_policy.items():
-                # Hash -> (Move, Tile)
-                m_idx = action_hash // 51
-                t_idx = action_hash % 51
 
-                # 確率を加算 (周辺化)
-                m_target[m_idx] += prob
-                t_target[t_idx] += prob
+@ray.remote(num_cpus=INFERENCE_NUM_THREADS, num_gpus=NUM_GPUS)
+class InferenceServer:
+    """
+    Ray Actor: 全Self-playワーカーの推論要求を集め、1回のforwardでまとめて処理する
+    INFERENCE_WAIT_MS ごと、または INFERENCE_MAX_BATCH 個溜まった時点でバッチを流す
+    """
+
+    def __init__(self, weights, compile_network=True):
+        # 推論はこのプロセスに集約されるので、確保したCPUをconvの内部並列に使う
+        torch.set_num_threads(INFERENCE_NUM_THREADS)
+        torch.set_num_interop_threads(1)
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # GPUではBF16 autocast + channels_lastで推論する (CPUはFP32のまま)
+        self.use_amp = self.device.type == "cuda"
+        self.amp_dtype = amp_dtype_for(self.device)
+        self.model = ContrastDualPolicyNet().to(self.device)
+        self.model.load_state_dict(weights)
+        self.model.eval()
+        # 推論にはConv+BNを畳み込んだコピーを使う (self.modelはウェイトの受け皿)
+        self.fused = fuse_conv_bn(self.model)
+        if self.use_amp:
+            self.fused.to(memory_format=torch.channels_last)
+        # Pythonの演算ディスパッチを省くためコンパイルしておく (バッチサイズは要求ごとに変わるのでdynamic)
+        # パラメータはself.fusedと共有されるので、set_weightsはself.fusedへ値を書き込むだけでよい
+        # コンパイルしない場合 (torch.compileがない環境を含む) は畳み込み済みのモデルをそのまま使う
+        if compile_network and hasattr(torch, "compile"):
+            self.network = torch.compile(self.fused, dynamic=True)
+        else:
+            self.network = self.fused
 
-            move_targets.append(m_target)
-            tile_targets.append(t_target)
+        self.pending = []  # [(states, future), ...]
+        self.pending_rows = 0
+        self._wakeup = None
+        self._batch_task = None
 
+    async def set_weights(self, weights):
+        """最新のウェイトに差し替える (以降のバッチから反映)"""
+        self.model.load_state_dict(weights)
+        # 畳み込み直した値をその場でコピーし、コンパイル済みのグラフはそのまま使い回す
+        self.fused.load_state_dict(fuse_conv_bn(self.model).state_dict())
+
+    async def infer(self, states: np.ndarray):
+        """
+        エンコード済みの状態 (B, 90, 5, 5) を推論する
+        Returns: (move_logits, tile_logits, values) のnumpy配列 (MCTS.evaluate と同じ形式)
+        """
+        if self._batch_task is None:
+            self._wakeup = asyncio.Event()
+            self._batch_task = asyncio.create_task(self._batch_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((states, future))
+        self.pending_rows += states.shape[0]
+        if self.pending_rows >= INFERENCE_MAX_BATCH:
+            self._wakeup.set()
+        return await future
+
+    async def _batch_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=INFERENCE_WAIT_MS / 1000)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self.pending:
+                continue
+
+            batch, self.pending, self.pending_rows = self.pending, [], 0
+            try:
+                move_logits, tile_logits, values = self._forward(
+                    np.concatenate([states for states, _ in batch])
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+
+            # 要求ごとに行を切り分けて返す
+            start = 0
+            for states, future in batch:
+                end = start + states.shape[0]
+                future.set_result(
+                    (move_logits[start:end], tile_logits[start:end], values[start:end])
+                )
+                start = end
+
+    def _forward(self, states: np.ndarray):
+        input_tensor = torch.from_numpy(states).to(self.device, non_blocking=True)
+        if self.use_amp:
+            input_tensor = input_tensor.contiguous(memory_format=torch.channels_last)
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device.type, dtype=self.amp_dtype, enabled=self.use_amp
+        ):
+            move_logits, tile_logits, values = self.network(input_tensor)
         return (
-            torch.tensor(np.array(states), dtype=torch.float32),
-            torch.tensor(np.array(move_targets), dtype=torch.float32),
-            torch.tensor(np.array(tile_targets), dtype=torch.float32),
-            torch.tensor(np.array(value_targets), dtype=torch.float32).unsqueeze(1),
+            move_logits.float().cpu().numpy(),
+            tile_logits.float().cpu().numpy(),
+            values.float().view(-1).cpu().numpy(),
         )
 
 
+class RemoteMCTS(MCTS):
+    """推論をInferenceServerに委譲するMCTS (ワーカー側はモデルを持たない)"""
+
+    def __init__(self, server, **kwargs):
+        super().__init__(network=None, device=torch.device("cpu"), **kwargs)
+        self.server = server
+
+    def evaluate(self, states: np.ndarray):
+        return ray.get(self.server.infer.remote(states))
+
+
 @ray.remote(num_cpus=1, num_gpus=0)
-def selfplay(weights, num_mcts_simulations, dirichlet_alpha=0.3):
+class SelfplayActor:
     """
-    Ray Worker: Self-playを実行してデータを収集
+    Ray Actor: Self-playを繰り返し実行してデータを収集する (プロセスはゲームをまたいで使い回す)
+    推論は共有のInferenceServerで行うので、ウェイトの更新はサーバー側だけでよい
     """
-    torch.set_num_threads(1)
-    # モデルの初期化 (CPU)
-    model = ContrastDualPolicyNet()
-    model.load_state_dict(weights)
-    model.eval()
-
-    # ゲームとMCTSの初期化
-    game = ContrastGame()
-    mcts = MCTS(network=model, device=torch.device("cpu"), alpha=dirichlet_alpha)
-
-    record = []
-    done = False
-    step = 0
-
-    while not done:
-        # MCTS実行
-        # mcts_policy: {action_hash: prob}
-        mcts_policy, action_values = mcts.search(game, num_mcts_simulations)
-
-        # 強制終了判定
-        if step >= MAX_STEPS:
-            done = True
-            winner = 0  # 引き分け扱い
-            break
-
-        # 温度パラメータの制御
-        # 序盤はランダム性を残し、中盤以降はGreedyに
-        actions = list(mcts_policy.keys())
-        probs = list(mcts_policy.values())
-
-        if step < 10:
-            # 温度 = 1 (確率に従って選択)
-            action = np.random.choice(actions, p=probs)
-        else:
-            # 温度 = 0 (最大確率の手を選択)
-            # dictの値が最大のものを選ぶ
-            action = max(mcts_policy, key=mcts_policy.get)
-
-        # 記録 (現在の状態、MCTSの分布、手番)
-        # encode_stateは (90, 5, 5) を返す
-        record.append(
-            Sample(
-                state=game.encode_state(),
-                mcts_policy=mcts_policy,
-                player=game.current_player,
-            )
+
+    def __init__(
+        self,
+        server,
+        num_mcts_simulations,
+        dirichlet_alpha=0.3,
+        mcts_batch_size=MCTS_BATCH_SIZE,
+    ):
+        torch.set_num_threads(1)
+        self.server = server
+        self.num_mcts_simulations = num_mcts_simulations
+        self.dirichlet_alpha = dirichlet_alpha
+        self.mcts_batch_size = mcts_batch_size
+        # 手の選択とルートのディリクレノイズで共有する乱数生成器
+        self.rng = np.random.default_rng()
+
+    def run_episode(self):
+        """1ゲーム分のSelf-playを行い、Sampleのリストを返す"""
+        num_mcts_simulations = self.num_mcts_simulations
+        mcts_batch_size = self.mcts_batch_size
+
+        # ゲームとMCTSの初期化 (探索木はゲーム内では手をまたいで使い回し、ゲームごとに作り直す)
+        game = ContrastGame()
+        mcts = RemoteMCTS(
+            self.server,
+            alpha=self.dirichlet_alpha,
+            value_cache_size=VALUE_CACHE_SIZE,
+            seed=self.rng,
         )
 
-        # 実行
-        done, winner = game.step(action)
-        step += 1
+        record = []
+        done = False
+        step = 0
 
-        if step % 10 == 0:
-            logger.debug(f"Worker Progress: step {step}")
+        while not done:
+            # MCTS実行 (Virtual Lossで葉を集めてバッチ推論)
+            # mcts_policy: {action_hash: prob}
+            mcts_policy, action_values = mcts.search_batched(
+                game, num_mcts_simulations, batch_size=mcts_batch_size
+            )
 
-    # 報酬の割り当て (Winner視点)
-    # game.winner: P1(1) or P2(2) or Draw(0)
-    for sample in record:
-        if winner == 0:
-            sample.reward = 0.0
-        else:
-            # 自分の手番で勝ったなら+1, 負けたなら-1
-            sample.reward = 1.0 if sample.player == winner else -1.0
+            # 強制終了判定
+            if step >= MAX_STEPS:
+                done = True
+                winner = 0  # 引き分け扱い
+                break
+
+            # 温度パラメータの制御
+            # 序盤はランダム性を残し、中盤以降はGreedyに
+            # 分布はdictではなく (hash, prob) の配列にして、選択と記録の両方で使う
+            n_actions = len(mcts_policy)
+            policy_idx = np.fromiter(mcts_policy.keys(), dtype=np.int32, count=n_actions)
+            visit_p = np.fromiter(mcts_policy.values(), dtype=np.float64, count=n_actions)
+
+            if step < 10:
+                # 温度 = 1 (確率に従って選択)
+                action = int(policy_idx[self.rng.choice(n_actions, p=visit_p)])
+            else:
+                # 温度 = 0 (最大確率の手を選択)
+                action = int(policy_idx[visit_p.argmax()])
+
+            # 記録 (現在の状態、MCTSの分布、手番)
+            # 状態はビット単位で詰める
+            record.append(
+                Sample(
+                    state=pack_state(game.encode_state()),
+                    policy_idx=policy_idx,
+                    policy_p=visit_p.astype(np.float16),
+                    player=game.current_player,
+                )
+            )
+
+            # 実行
+            done, winner = game.step(action)
+            step += 1
+            if not done:
+                # 選んだ手の部分木だけを残し、次の探索で統計を再利用する
+                mcts.advance_root(game)
+
+            if step % 10 == 0:
+                logger.debug(f"Worker Progress: step {step}")
+
+        # 報酬の割り当て (Winner視点)
+        # game.winner: P1(1) or P2(2) or Draw(0)
+        for sample in record:
+            if winner == 0:
+                sample.reward = 0.0
+            else:
+                # 自分の手番で勝ったなら+1, 負けたなら-1
+                sample.reward = 1.0 if sample.player == winner else -1.0
+
+        return record
+
+
+def collect_selfplay(work_in_progresses, replay, replay_lock, stop, errors):
+    """
+    収集スレッド: 完了したゲームをリプレイバッファへ追加し、同じActorで次のゲームを開始する
+    work_in_progresses: {実行中のタスク: そのActor}
+    例外 (Actorのクラッシュなど) で止まった場合は errors に入れ、学習ループ側で送出させる
+    """
+    try:
+        while not stop.is_set():
+            finished, _ = ray.wait(list(work_in_progresses), num_returns=1, timeout=1.0)
+            if not finished:
+                continue
+
+            # 完了したタスクから結果を取得
+            game_records = ray.get(finished[0])
+            with replay_lock:
+                replay.add_record(game_records)
 
-    return record
+            # 同じActorで次のゲームを開始 (ウェイトは推論サーバー側で更新済み)
+            actor = work_in_progresses.pop(finished[0])
+            work_in_progresses[actor.run_episode.remote()] = actor
+    except BaseException as exc:  # pylint: disable=broad-except
+        errors.append(exc)
 
 
-def main(n_parallel_selfplay=10, num_mcts_simulations=50):
+def cpu_state_dict(model):
+    """
+    モデルを移動させずに、ウェイトのCPUコピーを作る
+    GPU上のウェイトは非同期にコピーし、最後に1回だけ同期する
+    """
+    state = {
+        k: v.detach().to("cpu", non_blocking=True) for k, v in model.state_dict().items()
+    }
+    if any(v.is_cuda for v in model.state_dict().values()):
+        torch.cuda.synchronize()
+    return state
+
+
+def main(n_parallel_selfplay=None, num_mcts_simulations=50, compile_network=True):
     # Ray初期化
     ray.init(
         ignore_reinit_error=True,
@@ -173,23 +465,44 @@ def main(n_parallel_selfplay=10, num_mcts_simulations=50):
     logger.info(f"Training on {device}")
 
     # モデルとオプティマイザ
-    network = ContrastDualPolicyNet().to(device)
+    # model: 元のモジュール (state_dictの保存・配布用)、network: 学習で呼び出すモジュール
+    model = ContrastDualPolicyNet().to(device)
     optimizer = optim.Adam(
-        network.parameters(), lr=LEARNING_RATE, weight_decay=WEIGHT_DECAY
+        model.parameters(), lr=LEARNING_RATE, weight_decay=WEIGHT_DECAY
     )
 
+    # GPUでは混合精度 (ウェイトはFP32のまま) + channels_lastで学習する
+    # GradScalerはBF16では不要なのでFP16にフォールバックした場合のみ使う
+    use_amp = device.type == "cuda"
+    amp_dtype = amp_dtype_for(device)
+    scaler = torch.amp.GradScaler(
+        "cuda", enabled=use_amp and amp_dtype == torch.float16
+    )
+    if use_amp:
+        model.to(memory_format=torch.channels_last)
+    network = model
+    if compile_network:
+        # バッチサイズ固定の学習ステップをコンパイル (CUDAではCUDA Graphで起動コストも削減)
+        network = torch.compile(model, mode="reduce-overhead", fullgraph=True)
+
     # 初期ウェイトをRay Object Storeへ
-    # CPUに落としてから送る
-    current_weights_ref = ray.put(network.to("cpu").state_dict())
-    network.to(device)  # Trainer用にGPUに戻す
+    # CPUにコピーしてから送る (モデル自体は移動しないのでコンパイル済みのグラフを壊さない)
+    current_weights_ref = ray.put(cpu_state_dict(model))
+
+    # 全Workerで共有する推論サーバー
+    server = InferenceServer.remote(current_weights_ref, compile_network)
 
     replay = ReplayBuffer(buffer_size=BUFFER_SIZE)
 
-    # Workerの起動
-    work_in_progresses = [
-        selfplay.remote(current_weights_ref, num_mcts_simulations)
+    # Workerの起動 (実行中のタスク -> そのActor)
+    # 既定の数はInferenceServerに割り当てた分を除いたCPU数 (最大10)
+    if n_parallel_selfplay is None:
+        n_parallel_selfplay = max(1, min(10, NUM_CPUS - INFERENCE_NUM_THREADS))
+    actors = [
+        SelfplayActor.remote(server, num_mcts_simulations)
         for _ in range(n_parallel_selfplay)
     ]
+    work_in_progresses = {actor.run_episode.remote(): actor for actor in actors}
 
     # トレーニングループ
     total_steps = 0
@@ -198,63 +511,74 @@ def main(n_parallel_selfplay=10, num_mcts_simulations=50):
     # プログレスバー
     pbar = tqdm(total=max_steps, desc="Training Steps")
 
-    while total_steps < max_steps:
-        # 1. データ収集フェーズ (非同期実行の待ち受け)
-        # 一定数(例: 10ゲーム分)集まるまで待つ、あるいは完了した順に処理
-
-        finished, work_in_progresses = ray.wait(work_in_progresses, num_returns=1)
-
-        # 完了したタスクから結果を取得
-        game_records = ray.get(finished[0])
-        replay.add_record(game_records)
-
-        # Workerを再起動 (最新のウェイトを渡す)
-        work_in_progresses.append(
-            selfplay.remote(current_weights_ref, num_mcts_simulations)
-        )
-
-        # 2. 学習フェーズ
-        # バッファがある程度たまったら学習開始
-        if len(replay) > BATCH_SIZE:
-            # データ取得 (GPU転送込み)
-            states, m_targets, t_targets, v_targets = replay.get_minibatch(BATCH_SIZE)
-            states = states.to(device)
-            m_targets = m_targets.to(device)
-            t_targets = t_targets.to(device)
-            v_targets = v_targets.to(device)
+    # 1. データ収集 (バックグラウンドスレッド)
+    # 学習ステップと並行して、完了したゲームをリプレイバッファへ取り込み続ける
+    replay_lock = threading.Lock()
+    stop = threading.Event()
+    collector_errors = []
+    collector = threading.Thread(
+        target=collect_selfplay,
+        args=(work_in_progresses, replay, replay_lock, stop, collector_errors),
+        daemon=True,
+    )
+    collector.start()
+
+    try:
+        while total_steps < max_steps:
+            # 収集スレッドが止まっていたら、更新されないバッファで学習し続けずに例外を送出する
+            if collector_errors:
+                raise collector_errors[0]
+
+            # 2. 学習フェーズ
+            # バッファがある程度たまったら学習開始し、その後は新しいサンプルの数に応じたステップ数だけ進める
+            # (収集と学習は非同期なので、少数のゲームに何千ステップも費やさないようにする)
+            with replay_lock:
+                ready = (
+                    len(replay) >= max(BATCH_SIZE, MIN_REPLAY_SIZE)
+                    and total_steps < replay.total_added // SAMPLES_PER_TRAIN_STEP
+                )
+            if not ready:
+                time.sleep(0.1)
+                continue
+
+            # データ取得 (GPU転送込み、収集スレッドの書き込みとは排他)
+            with replay_lock:
+                states, m_targets, t_targets, v_targets = replay.get_minibatch(
+                    BATCH_SIZE, device
+                )
 
-            # 勾配リセット
-            optimizer.zero_grad()
+            # 勾配リセット (ゼロ埋めせずNoneにする)
+            optimizer.zero_grad(set_to_none=True)
 
-            # 推論
-            m_logits, t_logits, v_pred = network(states)
+            # 推論 (損失はFP32で計算する)
+            if use_amp:
+                states = states.contiguous(memory_format=torch.channels_last)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                m_logits, t_logits, v_pred = network(states)
+            m_logits, t_logits, v_pred = m_logits.float(), t_logits.float(), v_pred.float()
 
             # 損失計算
             # Value Loss: MSE
             value_loss = F.mse_loss(v_pred, v_targets)
 
             # Policy Loss: Cross Entropy
-            # PyTorchのCrossEntropyLossはTargetがクラスインデックスであることを期待するが、
-            # AlphaZeroはソフトターゲット(確率分布)を使うため、
-            # LogSoftmax + Sum(target * log_prob) の形式で計算する (KL Divergence相当)
-
-            m_log_probs = F.log_softmax(m_logits, dim=1)
-            t_log_probs = F.log_softmax(t_logits, dim=1)
-
-            move_loss = -torch.mean(torch.sum(m_targets * m_log_probs, dim=1))
-            tile_loss = -torch.mean(torch.sum(t_targets * t_log_probs, dim=1))
+            # AlphaZeroはソフトターゲット(確率分布)を使うが、cross_entropyは確率のTargetも
+            # そのまま受け取れる (-Sum(target * log_softmax) のバッチ平均と同じ)
+            move_loss = F.cross_entropy(m_logits, m_targets)
+            tile_loss = F.cross_entropy(t_logits, t_targets)
 
             loss = value_loss + move_loss + tile_loss
 
             # バックプロパゲーション
-            loss.backward()
-            optimizer.step()
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
 
             # 3. ウェイトの更新
             # 一定ステップごとにRay上のウェイトを更新
             if total_steps % 50 == 0:
-                current_weights_ref = ray.put(network.to("cpu").state_dict())
-                network.to(device)
+                current_weights_ref = ray.put(cpu_state_dict(model))
+                server.set_weights.remote(current_weights_ref)
 
                 # ログ出力
                 tqdm.write(
@@ -263,9 +587,12 @@ def main(n_parallel_selfplay=10, num_mcts_simulations=50):
 
             total_steps += 1
             pbar.update(1)
+    finally:
+        stop.set()
+        collector.join()
 
     # 終了処理
-    torch.save(network.state_dict(), "contrast_model_final.pth")
+    torch.save(model.state_dict(), "contrast_model_final.pth")
     logger.info("Training finished. Model saved.")
 
 
@@ -1,10 +1,69 @@
+import contextlib
 import math
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 
 import numpy as np
 import torch
-import torch.nn.functional as F
 
-from contrast_game import P2, ContrastGame, flip_action
+from contrast_game import P2, ContrastGame, flip_actions
+from logger import get_logger
+
+try:
+    from numba import njit
+except ImportError:  # numba未導入の環境ではNumPyのベクトル演算で選択する
+    njit = None
+
+logger = get_logger(__name__)
+
+
+def _puct_select_np(P, N, W, c_puct):
+    """PUCTスコアが最大のインデックス (NumPy版)"""
+    q = W / np.maximum(N, 1)
+    u = c_puct * P * math.sqrt(N.sum()) / (1 + N)
+    return int((q + u).argmax())
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _puct_select(P, N, W, c_puct):
+        """PUCTスコアが最大のインデックス (JIT対象、同点なら先頭)"""
+        sqrt_sum_n = math.sqrt(N.sum())
+        best_score = -np.inf
+        best_idx = 0
+        for i in range(P.shape[0]):
+            n = N[i]
+            q = W[i] / n if n > 0 else 0.0
+            u = c_puct * P[i] * sqrt_sum_n / (1 + n)
+            score = q + u
+            if score > best_score:
+                best_score = score
+                best_idx = i
+        return best_idx
+
+    # import時にコンパイルしておく (Nodeの配列と同じdtype)
+    _puct_select(
+        np.ones(1, dtype=np.float32),
+        np.zeros(1, dtype=np.int32),
+        np.zeros(1, dtype=np.float64),
+        1.0,
+    )
+else:
+    _puct_select = _puct_select_np
+
+
+@dataclass(slots=True)
+class Node:
+    """展開済みノードの統計 (合法手ごとの連続配列、インデックスは actions と共通)"""
+
+    actions: np.ndarray  # (A,) int32 実アクションハッシュ
+    P: np.ndarray  # (A,) float32 事前確率
+    N: np.ndarray  # (A,) int32 訪問回数
+    W: np.ndarray  # (A,) float64 累積価値
+    value: float  # 展開時のネットワークの評価値 (手番側視点)
 
 
 class MCTS:
@@ -15,231 +74,482 @@ class MCTS:
         alpha=0.3,
         c_puct=1.0,
         epsilon=0.25,
+        virtual_loss=1.0,
+        use_amp: bool = False,
         debug: bool = False,
+        value_cache_size: int = 0,
+        amp_dtype: torch.dtype = torch.float16,
+        seed=None,
+        pad_batch_size: int = 0,
     ):
         self.network = network
+        if network is not None:
+            # 推論専用 (展開のたびにeval()を呼ばないよう、ここで一度だけ切り替える)
+            network.eval()
         self.device = device
         self.alpha = alpha
         self.c_puct = c_puct
         self.eps = epsilon
+        self.virtual_loss = virtual_loss
+        # autocastで推論するか (CUDAはFP16/BF16、CPUはBF16を指定した場合のみ)
+        self.amp_dtype = amp_dtype
+        self.use_amp = use_amp and (
+            device.type == "cuda" or amp_dtype == torch.bfloat16
+        )
         self.debug = debug
-
-        # 状態の識別キー: (pieces_bytes, tiles_bytes, counts_bytes, player_int, move_count)
-        self.P = {}
-        self.N = {}
-        self.W = {}
+        # ルートのディリクレノイズ用の乱数生成器 (Generatorを渡せば呼び出し側と共有できる)
+        self.rng = np.random.default_rng(seed)
+        # 推論バッチをこの行数までゼロ埋めする (0なら無効)
+        # 形状を固定してコンパイルしたネットワークが、端数や重複除去で縮んだバッチで再コンパイルしないようにする
+        self.pad_batch_size = pad_batch_size
+
+        # バッチ推論用のCUDAストリーム (葉の選択と推論をオーバーラップさせる)
+        self.stream = torch.cuda.Stream(device) if device.type == "cuda" else None
+        # GPU転送用のステージングバッファ (pinned CPU / GPU、必要なバッチサイズまで拡張)
+        self._staging_cpu = None
+        self._staging_gpu = None
+
+        # 状態の識別キー (ContrastGame.state_key) -> 展開済みノード
+        self.nodes = {}
+        # 直前の探索でのルートのネットワーク評価値 (探索前の形勢ログ用、ルートが終局なら None)
+        self.root_value = None
+        # 未展開ノードのencode_state結果 (展開されるまで保持し、重複した葉で再利用する)
+        self.encoded = {}
+        # 盤面のZobristハッシュ -> (actions, P, value) のLRUキャッシュ (0なら無効)
+        # 手順違いで同じ盤面に合流した場合に推論を省く (履歴・手数プレーンの違いは無視する近似)
+        self.value_cache_size = value_cache_size
+        self.value_cache = OrderedDict()
 
     def game_to_key(self, game: ContrastGame):
         """
         ContrastGameの状態を一意なハッシュ可能オブジェクト(タプル)に変換
         修正: move_countを含めることで、盤面が同一でも手数が違えば別状態として扱い、循環(無限再帰)を防ぐ
+        キーはゲーム側でstepまでキャッシュされ、copy()にも引き継がれる
         """
-        return (
-            game.pieces.tobytes(),
-            game.tiles.tobytes(),
-            game.tile_counts.tobytes(),
-            game.current_player,
-            game.move_count,  # <--- 重要: これを追加
-        )
+        return game.state_key()
 
-    def search(self, root_game: ContrastGame, num_simulations: int):
+    def advance_root(self, game: ContrastGame):
+        """
+        手を進めた後に呼び、新しいルート (game) から到達できるノードだけを残す
+        訪問済みの辺をたどって残すので、部分木の統計は次の探索でそのまま使われる
+        """
+        self.encoded.clear()
+        root_key = self.game_to_key(game)
+        if root_key not in self.nodes:
+            self.nodes.clear()
+            return
+
+        kept = {root_key: self.nodes[root_key]}
+        stack = [game.copy()]
+        while stack:
+            parent = stack.pop()
+            node = kept[self.game_to_key(parent)]
+            for action in node.actions[node.N > 0].tolist():
+                child = parent.copy()
+                child.step(action)
+                if child.game_over:
+                    continue
+                key = self.game_to_key(child)
+                if key in kept or key not in self.nodes:
+                    continue
+                kept[key] = self.nodes[key]
+                stack.append(child)
+        self.nodes = kept
+
+    def _prepare_root(self, root_game: ContrastGame):
+        """
+        ルートを展開してディリクレノイズを付加する
+        合法手がなければ None を返す
+        """
         root_key = self.game_to_key(root_game)
 
         # 未展開ならルートを展開
-        if root_key not in self.P:
-            self._expand(root_game)
-
-        # 辞書アクセスに修正 (None対策)
-        if root_key not in self.P:
-            return {}, {}
-
-        valid_actions = list(self.P[root_key].keys())
+        if root_key not in self.nodes:
+            self._expand(root_game, root_key)
+        root = self.nodes.get(root_key)
+        self.root_value = root.value if root is not None else None
 
         # 合法手がない場合
-        if not valid_actions:
-            return {}, {}
+        if root is None or root.actions.size == 0:
+            return None
 
         # ルートノードにディリクレノイズを付加
-        dirichlet_noise = np.random.dirichlet([self.alpha] * len(valid_actions))
-        for i, action in enumerate(valid_actions):
-            self.P[root_key][action] = (1 - self.eps) * self.P[root_key][
-                action
-            ] + self.eps * dirichlet_noise[i]
+        dirichlet_noise = self.rng.dirichlet(np.full(root.actions.size, self.alpha))
+        root.P[:] = (1 - self.eps) * root.P + self.eps * dirichlet_noise
+
+        return root
+
+    def search(self, root_game: ContrastGame, num_simulations: int):
+        root = self._prepare_root(root_game)
+        if root is None:
+            return {}, {}
 
         # シミュレーション実行
         for sim in range(num_simulations):
             # ルートからの探索を開始 (コピーを使用)
-            leaf_value = self._evaluate(root_game.copy())
-            print(root_game)
+            # 再帰せずに葉まで降り、展開後に経路を逆順にたどってバックアップする
+            path, leaf, key, leaf_value = self._select_leaf(root_game.copy())
+            if leaf_value is None:
+                leaf_value = self._expand(leaf, key)
+            self._backup(path, leaf_value)
             if self.debug:
-                self._log_root_stats(root_key, valid_actions, sim + 1, num_simulations, leaf_value)
+                self._log_root_stats(root, sim + 1, num_simulations, leaf_value)
+
+        return self._root_results(root)
 
-        # 訪問回数に基づいたPolicyを返す
-        root_visits = sum(self.N[root_key].values())
+    def _root_results(self, root: Node):
+        """訪問回数に基づいたPolicyと各アクションのQ値を返す"""
+        actions = root.actions.tolist()
+        root_visits = int(root.N.sum())
         if root_visits == 0:
             # 万が一訪問が0回の場合(通常ありえないが)は一様分布を返す
-            return {a: 1.0 / len(valid_actions) for a in valid_actions}, {}
+            return {a: 1.0 / len(actions) for a in actions}, {}
 
-        mcts_policy = {a: self.N[root_key][a] / root_visits for a in valid_actions}
+        mcts_policy = dict(zip(actions, (root.N / root_visits).tolist()))
 
         # 各アクションの評価値 (Q値) を計算
-        action_values = self._compute_action_values(root_key, valid_actions)
+        action_values = self._compute_action_values(root)
 
         if self.debug:
-            self._log_root_summary(root_key, valid_actions, action_values)
+            self._log_root_summary(root, action_values)
 
         return mcts_policy, action_values
 
-    def _evaluate(self, game: ContrastGame):
+    def search_batched(
+        self, root_game: ContrastGame, num_simulations: int, batch_size: int = 16
+    ):
         """
-       再帰的な探索関数
+        Virtual Lossを用いて最大batch_size個の葉を集め、1回の推論でまとめて評価する
+        葉の選択・エンコードは別スレッドで行い、前のバッチの推論と並行させる
+        戻り値は search() と同じ
         """
-        key = self.game_to_key(game)
+        root = self._prepare_root(root_game)
+        if root is None:
+            return {}, {}
 
-        # 1. ゲーム終了判定
-        if game.game_over:
-            if game.winner == 0:  # Draw
-                return 0
-            # current_playerが勝者なら1, 敗者なら-1
-            # 注意: evaluateに入った時点の手番プレイヤー視点での価値
-            return 1 if game.winner == game.current_player else -1
+        # 木(P/N/W)への読み書きはこのロックで保護する
+        tree_lock = threading.Lock()
+        stop = threading.Event()
+        batches = queue.Queue(maxsize=2)
+        producer = threading.Thread(
+            target=self._produce_batches,
+            args=(root_game, num_simulations, max(1, batch_size), tree_lock, stop, batches),
+            daemon=True,
+        )
+        producer.start()
+
+        try:
+            sims_done = 0
+            while True:
+                item = batches.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                pending, states, rows = item
+                move_logits, tile_logits, values = self.evaluate(states)
+
+                # 展開・バックアップ (Virtual Lossの取り消しを含む)
+                with tree_lock:
+                    for (path, leaf, key), r in zip(pending, rows):
+                        leaf_value = self._store_priors(
+                            leaf, key, move_logits[r], tile_logits[r], float(values[r])
+                        )
+                        self._backup(path, leaf_value)
+
+                    sims_done += len(pending)
+                    if self.debug:
+                        self._log_root_stats(root, sims_done, num_simulations, leaf_value)
+        finally:
+            # 途中で例外が出た場合もProducerがput待ちで止まらないようにキューを空ける
+            stop.set()
+            while producer.is_alive():
+                with contextlib.suppress(queue.Empty):
+                    batches.get(timeout=0.01)
+            producer.join()
+
+        return self._root_results(root)
+
+    def _produce_batches(
+        self, root_game, num_simulations, batch_size, tree_lock, stop, batches
+    ):
+        """
+        Producerスレッド: Virtual Lossを掛けながら葉を収集し、エンコード済みのバッチをキューへ流す
+        終了時は None、例外時はその例外をキューへ入れる
+        """
+        try:
+            sims_done = 0
+            while sims_done < num_simulations and not stop.is_set():
+                n = min(batch_size, num_simulations - sims_done)
+
+                pending = []  # (path, leaf_game, leaf_key)
+                with tree_lock:
+                    for _ in range(n):
+                        path, leaf, key, leaf_value = self._select_leaf(root_game.copy())
+                        if leaf_value is None:
+                            leaf_value = self._expand_from_cache(leaf, key)
+                        if leaf_value is None:
+                            pending.append((path, leaf, key))
+                        else:
+                            # 終局など推論不要な葉は即座にバックアップ
+                            self._backup(path, leaf_value)
+                    if pending:
+                        states, rows = self._encode_batch(pending)
+                sims_done += n
+
+                if pending:
+                    batches.put((pending, states, rows))
+            batches.put(None)
+        except BaseException as exc:  # pylint: disable=broad-except
+            batches.put(exc)
+
+    def _select_leaf(self, game: ContrastGame):
+        """
+        PUCTで葉まで降りる (Virtual Lossを経路に適用)
+        Returns:
+            path: [(node, action_idx), ...]
+            game: 葉の状態
+            key: 葉の識別キー (終局なら None)
+            value: 推論不要な葉ならその価値 (葉の手番視点)、推論が必要なら None
+        """
+        path = []
+        while True:
+            if game.game_over:
+                if game.winner == 0:
+                    return path, game, None, 0.0
+                value = 1.0 if game.winner == game.current_player else -1.0
+                return path, game, None, value
 
-        # 2. 未展開ノードなら展開して値を返す
-        if key not in self.P:
-            value = self._expand(game)
-            return value
+            key = self.game_to_key(game)
+            node = self.nodes.get(key)
+            if node is None:
+                return path, game, key, None
 
-        # 3. 展開済みならPUCTでアクション選択
-        valid_actions = list(self.P[key].keys())
+            if node.actions.size == 0:
+                return path, game, key, 0.0
 
-        if not valid_actions:
-            # 展開済みだが合法手がない（ゲーム終了扱い漏れなど）
-            return 0
+            idx = self._select_action(node)
 
-        sum_n = sum(self.N[key].values())
-        sqrt_sum_n = math.sqrt(sum_n)
+            # Virtual Loss: 同じバッチ内の他の探索が別経路を選ぶようにする
+            node.W[idx] -= self.virtual_loss
+            node.N[idx] += 1
+            path.append((node, idx))
 
-        best_score = -float("inf")
-        best_action = -1
+            game.step(int(node.actions[idx]))
 
-        for action in valid_actions:
-            p = self.P[key][action]
-            n = self.N[key][action]
-            w = self.W[key][action]
+    def _select_action(self, node: Node):
+        """PUCTスコアが最大のアクションのインデックスを返す"""
+        return int(_puct_select(node.P, node.N, node.W, float(self.c_puct)))
 
-            q = w / n if n > 0 else 0
-            u = self.c_puct * p * sqrt_sum_n / (1 + n)
+    def _backup(self, path, value):
+        """
+        葉の価値を経路に沿って伝播し、Virtual Lossを取り消す
+        value は葉の手番プレイヤー視点
+        """
+        for node, idx in reversed(path):
+            value = -value
+            node.W[idx] += self.virtual_loss + value
+            # Virtual Lossで加算済みの訪問回数がそのまま本来の +1 になる
 
-            score = q + u
+    def _expand(self, game, key):
+        """
+        ニューラルネットで推論し、Prior ProbabilityとValueを計算して保存する
+        """
+        cached_value = self._expand_from_cache(game, key)
+        if cached_value is not None:
+            return cached_value
 
-            if score > best_score:
-                best_score = score
-                best_action = action
+        # encode_state内でP2なら自動的に反転される
+        move_logits, tile_logits, values = self.evaluate(
+            self._encoded_state(game, key)[None]
+        )
 
-        # 4. 次の状態へ遷移 & 再帰 (Simulation step)
-        # 以前の修正: 引数を1つにする
-        game.step(best_action)
+        return self._store_priors(
+            game, key, move_logits[0], tile_logits[0], float(values[0])
+        )
 
-        # 相手の手番での価値が返ってくるため反転させる
-        v = -self._evaluate(game)
+    def _expand_from_cache(self, game, key):
+        """value_cacheに同じ盤面があれば推論せずに展開し、その価値を返す (なければ None)"""
+        if not self.value_cache_size:
+            return None
+        board_hash = game.zobrist()
+        cached = self.value_cache.get(board_hash)
+        if cached is None:
+            return None
+        self.value_cache.move_to_end(board_hash)
+
+        actions, probs, value = cached
+        self.nodes[key] = Node(
+            actions=actions,
+            P=probs.copy(),  # ルートではディリクレノイズで書き換えるのでコピー
+            N=np.zeros(actions.size, dtype=np.int32),
+            W=np.zeros(actions.size, dtype=np.float64),
+            value=value,
+        )
+        return value
 
-        # 5. バックプロパゲーション
-        self.W[key][best_action] += v
-        self.N[key][best_action] += 1
+    def _encoded_state(self, game, key):
+        """ノードのencode_state結果を返す (キャッシュがあれば再利用)"""
+        state = self.encoded.get(key)
+        if state is None:
+            state = game.encode_state()
+            self.encoded[key] = state
+        return state
 
-        return v
+    def _encode_batch(self, pending):
+        """
+        複数の葉を (B, 90, 5, 5) の配列にまとめる
+        同じ状態の葉は1行にまとめる
+        Returns: (states, rows) rows[i] は pending[i] が参照する行
+        """
+        row_of_key = {}
+        encoded = []
+        rows = []
+        for _, leaf, key in pending:
+            if key not in row_of_key:
+                row_of_key[key] = len(encoded)
+                encoded.append(self._encoded_state(leaf, key))
+            rows.append(row_of_key[key])
+
+        return np.stack(encoded), rows
+
+    def evaluate(self, states: np.ndarray):
+        """
+        エンコード済みの状態 (B, 90, 5, 5) を1回のforwardで推論する
+        Returns: (move_logits, tile_logits, values) のnumpy配列
+        """
+        n = states.shape[0]
+        if n < self.pad_batch_size:
+            padded = np.zeros((self.pad_batch_size,) + states.shape[1:], dtype=states.dtype)
+            padded[:n] = states
+            states = padded
+
+        if self.stream is None:
+            input_tensor = torch.from_numpy(states).to(self.device)
+            outputs = self._forward_numpy(input_tensor)
+        else:
+            with torch.cuda.stream(self.stream):
+                outputs = self._forward_numpy(self._stage(states))
+
+        if states.shape[0] == n:
+            return outputs
+        return tuple(output[:n] for output in outputs)
+
+    def warmup(self):
+        """
+        探索と同じ経路 (CUDAストリーム・パディング後の形状) で一度推論し、
+        コンパイル済みネットワークのトレース・CUDA Graphのキャプチャを探索前に済ませる
+        """
+        self.evaluate(ContrastGame().encode_state()[None])
 
-    def _expand(self, game):
+    def _stage(self, states: np.ndarray):
         """
-        ニューラルネットで推論し、Prior ProbabilityとValueを計算して保存する
+        事前確保したpinned memory経由でGPUの入力バッファへ非同期転送する
+        推論結果を.cpu()で受け取るまで同期されるので、バッファは次の呼び出しで再利用できる
         """
-        key = self.game_to_key(game)
+        n = states.shape[0]
+        if self._staging_cpu is None or self._staging_cpu.shape[0] < n:
+            self._staging_cpu = torch.empty(
+                (n,) + states.shape[1:], dtype=torch.float32, pin_memory=True
+            )
+            self._staging_gpu = torch.empty_like(self._staging_cpu, device=self.device)
 
-        # encode_state内でP2なら自動的に反転される
-        input_tensor = (
-            torch.from_numpy(game.encode_state()).unsqueeze(0).to(self.device)
+        self._staging_cpu[:n].copy_(torch.from_numpy(states))
+        self._staging_gpu[:n].copy_(self._staging_cpu[:n], non_blocking=True)
+        return self._staging_gpu[:n]
+
+    def _forward_numpy(self, input_tensor):
+        move_logits, tile_logits, values = self._forward(input_tensor)
+        return (
+            move_logits.cpu().numpy(),
+            tile_logits.cpu().numpy(),
+            values.view(-1).cpu().numpy(),
         )
 
-        self.network.eval()
-        with torch.no_grad():
+    def _forward(self, input_tensor):
+        """ネットワーク推論 (use_amp時はamp_dtypeでautocast)"""
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device.type, dtype=self.amp_dtype, enabled=self.use_amp
+        ):
             move_logits, tile_logits, value = self.network(input_tensor)
+        return move_logits.float(), tile_logits.float(), value.float()
 
-        value = value.item()
-
-        legal_actions = game.get_all_legal_actions()
+    def _store_priors(self, game, key, m_logits, t_logits, value):
+        """推論結果から合法手のPriorを計算してノードに保存する"""
+        # 展開後はエンコード結果を参照しないので解放する
+        self.encoded.pop(key, None)
 
-        if not legal_actions:
-            self.P[key] = {}
-            self.N[key] = {}
-            self.W[key] = {}
+        # 同じバッチで同じ葉に到達した場合は展開済み
+        if key in self.nodes:
             return value
 
-        m_logits = move_logits[0].cpu().numpy()
-        t_logits = tile_logits[0].cpu().numpy()
+        # 実ハッシュ (ノードにはこちらを保存)
+        actions = game.legal_actions_array()
 
-        temp_logits = []
-        action_mapping = []
+        if actions.size == 0:
+            self.nodes[key] = Node(
+                actions=actions,
+                P=np.empty(0, dtype=np.float32),
+                N=np.empty(0, dtype=np.int32),
+                W=np.empty(0, dtype=np.float64),
+                value=value,
+            )
+            return value
 
-        # P2の場合は、実アクション(legal_actions)を「反転」させてから
+        # P2の場合は、実アクション(actions)を「反転」させてから
         # ネットワークの出力(反転済みの盤面に対する推論)を参照する
-        should_flip = game.current_player == P2
-
-        for action_hash in legal_actions:
-            # ネットワークに問い合わせるためのハッシュ
-            query_hash = flip_action(action_hash) if should_flip else action_hash
-
-            # デコード (51 = ContrastGame.ACTION_SIZE_TILE)
-            move_idx = query_hash // 51
-            tile_idx = query_hash % 51
-
-            combined_logit = m_logits[move_idx] + t_logits[tile_idx]
-            temp_logits.append(combined_logit)
-            action_mapping.append(action_hash)  # 辞書には実ハッシュを保存
-
-        temp_logits = np.array(temp_logits)
-        probs = F.softmax(torch.tensor(temp_logits), dim=0).numpy()
-
-        self.P[key] = {}
-        self.N[key] = {}
-        self.W[key] = {}
+        query = flip_actions(actions) if game.current_player == P2 else actions
+
+        # デコード (51 = ContrastGame.ACTION_SIZE_TILE) して全合法手のlogitを一括で取得
+        temp_logits = m_logits[query // 51] + t_logits[query % 51]
+
+        # 合法手だけでのsoftmax (小さいベクトルなのでtorchを経由せずNumPyで計算)
+        exp_logits = np.exp(temp_logits - temp_logits.max())
+        probs = exp_logits / exp_logits.sum()
+
+        probs = probs.astype(np.float32)
+        num_actions = actions.size
+        self.nodes[key] = Node(
+            actions=actions,
+            P=probs.copy() if self.value_cache_size else probs,
+            N=np.zeros(num_actions, dtype=np.int32),
+            W=np.zeros(num_actions, dtype=np.float64),
+            value=value,
+        )
 
-        for action_hash, prob in zip(action_mapping, probs):
-            self.P[key][action_hash] = prob
-            self.N[key][action_hash] = 0
-            self.W[key][action_hash] = 0
+        if self.value_cache_size:
+            self.value_cache[game.zobrist()] = (actions, probs, value)
+            if len(self.value_cache) > self.value_cache_size:
+                self.value_cache.popitem(last=False)
 
         return value
 
-    def _compute_action_values(self, key, actions):
-        values = {}
-        for action in actions:
-            n = self.N[key][action]
-            values[action] = self.W[key][action] / n if n > 0 else 0.0
-        return values
+    def _compute_action_values(self, node: Node):
+        q = node.W / np.maximum(node.N, 1)
+        return dict(zip(node.actions.tolist(), q.tolist()))
 
-    def _log_root_stats(self, root_key, actions, sim_idx, total_sims, leaf_value):
-        root_visits = sum(self.N[root_key].values())
-        print(
+    def _log_root_stats(self, root: Node, sim_idx, total_sims, leaf_value):
+        root_visits = int(root.N.sum())
+        logger.debug(
             f"[MCTS][sim {sim_idx}/{total_sims}] leaf_value={leaf_value:.3f} total_visits={root_visits}"
         )
-        for action in actions[: min(5, len(actions))]:
-            n = self.N[root_key][action]
-            w = self.W[root_key][action]
-            p = self.P[root_key][action]
+        for i in range(min(5, root.actions.size)):
+            n = int(root.N[i])
+            w = float(root.W[i])
+            p = float(root.P[i])
             q = w / n if n > 0 else 0.0
-            print(
-                f"    action {action}: N={n}, W={w:.3f}, Q={q:.3f}, P={p:.3f}"
+            logger.debug(
+                f"    action {int(root.actions[i])}: N={n}, W={w:.3f}, Q={q:.3f}, P={p:.3f}"
             )
 
-    def _log_root_summary(self, root_key, actions, action_values):
-        root_visits = sum(self.N[root_key].values())
-        print(f"[MCTS] completed search with {root_visits} visits")
-        sorted_actions = sorted(
-            actions,
-            key=lambda a: self.N[root_key][a],
-            reverse=True,
-        )
-        for action in sorted_actions[: min(5, len(sorted_actions))]:
-            print(
-                f"    action {action}: N={self.N[root_key][action]}, Q={action_values[action]:.3f}, P={self.P[root_key][action]:.3f}"
+    def _log_root_summary(self, root: Node, action_values):
+        root_visits = int(root.N.sum())
+        logger.debug(f"[MCTS] completed search with {root_visits} visits")
+        # 訪問回数の降順 (同数なら元の順序)
+        order = np.argsort(-root.N, kind="stable")
+        for i in order[: min(5, order.size)].tolist():
+            action = int(root.actions[i])
+            logger.debug(
+                f"    action {action}: N={int(root.N[i])}, Q={action_values[action]:.3f}, P={float(root.P[i]):.3f}"
             )
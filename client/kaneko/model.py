@@ -1,6 +1,9 @@
+import copy
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 
 from logger import get_logger
 
@@ -122,6 +125,51 @@ class ContrastDualPolicyNet(nn.Module):
         return move_logits, tile_logits, value
 
 
+def fuse_conv_bn(model: ContrastDualPolicyNet) -> ContrastDualPolicyNet:
+    """
+    推論専用のコピーを作り、Conv2d + BatchNorm2d を1つのConv2dに畳み込む
+    BNの統計量を重みとバイアスに吸収させ、BNはIdentityに置き換える (forwardはそのまま使える)
+    evalモードのBNでのみ等価なので、学習には元のmodelを使うこと
+    """
+    fused = copy.deepcopy(model).eval()
+    pairs = [
+        (fused, "conv_input", "bn_input"),
+        (fused, "move_conv", "move_bn"),
+        (fused, "tile_conv", "tile_bn"),
+        (fused, "value_conv", "value_bn"),
+    ]
+    for block in fused.res_blocks:
+        pairs += [(block, "conv1", "bn1"), (block, "conv2", "bn2")]
+
+    for module, conv_name, bn_name in pairs:
+        conv = getattr(module, conv_name)
+        bn = getattr(module, bn_name)
+        setattr(module, conv_name, fuse_conv_bn_eval(conv, bn))
+        setattr(module, bn_name, nn.Identity())
+    return fused
+
+
+def compile_for_inference(model: nn.Module, device: torch.device, log=logger.info) -> nn.Module:
+    """
+    推論専用にモデルを最適化する (入力は (B, 90, 5, 5)、バッチサイズは呼び出し側で固定する)
+    torch.compileがあれば形状固定 + reduce-overhead (CUDA Graph) でコンパイルし、
+    ない環境 (torch 1.x) ではTorchScriptでトレースしてfreezeする
+    torch.compileのトレースは最初の呼び出しで行われるので、探索前に MCTS.warmup を呼ぶこと
+    log: 選んだ方法の出力先 (logger.info や print)
+    """
+    model.eval()
+    if hasattr(torch, "compile"):
+        log("torch.compileでモデルをコンパイルします")
+        return torch.compile(model, mode="reduce-overhead", fullgraph=True, dynamic=False)
+
+    log("torch.compileが使えないため、torch.jit.trace + freezeで最適化します")
+    example = torch.zeros(1, 90, 5, 5, device=device)
+    with torch.no_grad():
+        traced = torch.jit.trace(model, example)
+    # パラメータを定数として埋め込み、Conv+BNの畳み込みなどを適用する
+    return torch.jit.freeze(traced)
+
+
 # --- 損失関数の定義例 ---
 def loss_function(
     move_logits, tile_logits, value_pred, move_targets, tile_targets, value_targets
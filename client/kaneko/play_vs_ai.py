@@ -1,7 +1,10 @@
 import argparse
+import sys
 from pathlib import Path
 
+import numpy as np
 import torch
+import torch.multiprocessing as mp
 
 from contrast_game import (
     OPPONENT,
@@ -11,89 +14,256 @@ from contrast_game import (
     TILE_GRAY,
     TILE_WHITE,
     ContrastGame,
-    decode_action,
+    _DECODE_TABLE,
 )
 from logger import get_logger, setup_logger
 from mcts import MCTS
-from model import ContrastDualPolicyNet
+from model import ContrastDualPolicyNet, compile_for_inference
 
 logger = get_logger(__name__)
 
-
-class HumanVsAI:
-    def __init__(self, model_path, num_simulations=50, human_player=P1):
-        """
-        Args:
-            model_path: 学習済みモデルのパス
-            num_simulations: MCTSのシミュレーション回数
-            human_player: 人間が操作するプレイヤー (P1 or P2)
-        """
-        self.human_player = human_player
-        self.ai_player = OPPONENT[human_player]
+# 推論結果を盤面ごとに使い回す件数 (ターンをまたいで保持する)
+VALUE_CACHE_SIZE = 100000
+
+# 盤面表示用: (タイル, 駒) -> マスの表示文字列
+_TILE_SYMBOLS = {TILE_WHITE: "□", TILE_BLACK: "■", TILE_GRAY: "▦"}
+_CELL_LUT = {
+    (tile, piece): (f"[{piece}{symbol}]" if piece else f" {symbol} ")
+    for tile, symbol in _TILE_SYMBOLS.items()
+    for piece in (0, P1, P2)
+}
+_COLUMN_HEADER = "   " + "".join(f" {x} " for x in range(5))
+
+
+# 表示用の移動元・移動先座標 (625 * 51, 4) [fx, fy, tx, ty]
+# ルール側と食い違わないよう、contrast_gameのデコード表の列をそのまま参照する
+_ACTION_LUT = _DECODE_TABLE[:, :4]
+# タイル配置部分 (アクションハッシュ % 51) の表示文字列: なし / 黒タイル25マス / グレータイル25マス
+_TILE_STRINGS = [""] + [
+    f" + {name}を({pos % 5},{pos // 5})に配置"
+    for name in ("黒タイル", "グレータイル")
+    for pos in range(25)
+]
+
+
+def _format_action(action: int, decoded=None) -> str:
+    """
+    アクションハッシュを表示用の文字列 "(fx,fy) → (tx,ty) [+ タイル配置]" にする
+    decoded: 呼び出し側でまとめて引いた _ACTION_LUT の行 (省略時はここで引く)
+    """
+    if decoded is None:
+        decoded = _ACTION_LUT[action].tolist()
+    fx, fy, tx, ty = decoded
+    return f"({fx},{fy}) → ({tx},{ty})" + _TILE_STRINGS[action % ContrastGame.ACTION_SIZE_TILE]
+
+
+class AIEngine:
+    """AIの思考部分: モデルとMCTSを保持し、局面に対する探索結果を返す"""
+
+    def __init__(
+        self, model_path, num_simulations=50, mcts_batch_size=16, compile_network=False
+    ):
         self.num_simulations = num_simulations
-        self.action_history = []
+        self.mcts_batch_size = mcts_batch_size
 
         # デバイス設定
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         logger.info(f"Using device: {self.device}")
 
         # モデルのロード
-        self.model = ContrastDualPolicyNet().to(self.device)
+        # 重みはmmapで読み込んでパラメータとしてそのまま使い (assign)、中間コピーを作らずにdeviceへ移す
+        self.model = ContrastDualPolicyNet()
         if Path(model_path).exists():
-            self.model.load_state_dict(torch.load(model_path, map_location=self.device))
+            state = torch.load(model_path, map_location="cpu", mmap=True)
+            self.model.load_state_dict(state, assign=True)
             logger.info(f"Model loaded from {model_path}")
         else:
             logger.warning(
                 f"Model file not found: {model_path}. Using untrained model."
             )
-        self.model.eval()
+        self.model.to(self.device).eval()
+
+        # 混合精度: GPUはBF16 (非対応ならFP16) + channels_last、CPUはBF16命令がある場合のみBF16
+        self.use_amp, self.amp_dtype = self._select_amp()
+        if self.device.type == "cuda":
+            self.model.to(memory_format=torch.channels_last)
+            # 入力形状は (B, 90, 5, 5) で固定なので、cuDNNに最速のconvカーネルを選ばせる
+            torch.backends.cudnn.benchmark = True
+            torch.set_float32_matmul_precision("high")
+        if compile_network:
+            self.model = compile_for_inference(self.model, self.device, log=logger.info)
+
+        # MCTS初期化 (ゲームを通して同じインスタンスを使い、value_cacheをターン間で共有する)
+        self.mcts = MCTS(
+            network=self.model,
+            device=self.device,
+            use_amp=self.use_amp,
+            amp_dtype=self.amp_dtype,
+            value_cache_size=VALUE_CACHE_SIZE,
+            # コンパイル時は葉バッチを常に mcts_batch_size 行に揃え、形状を1つに固定する
+            pad_batch_size=mcts_batch_size if compile_network else 0,
+        )
+        if compile_network:
+            # 最初のAIの手番にコンパイル時間が乗らないよう、探索と同じ経路で事前にトレースしておく
+            self.mcts.warmup()
+
+    def search(self, game):
+        """MCTS実行 (Virtual Lossで葉を集めてバッチ推論)。戻り値は MCTS.search と同じ"""
+        # 探索木は advance で前のターンから引き継いでいるので、その統計に上乗せする
+        return self.mcts.search_batched(
+            game, self.num_simulations, batch_size=self.mcts_batch_size
+        )
+
+    def advance(self, game):
+        """手が指された後に呼び、新しい局面 (game) 以下の部分木だけを次の探索に残す"""
+        self.mcts.advance_root(game)
+
+    def close(self):
+        """同じプロセス内で動くので解放するものはない (EngineProcessと同じインターフェース)"""
+
+    def _select_amp(self):
+        """推論に使う (use_amp, dtype) を決める"""
+        if self.device.type == "cuda":
+            if torch.cuda.is_bf16_supported():
+                return True, torch.bfloat16
+            return True, torch.float16
+        # CPUでBF16命令 (AVX512-BF16) がなければFP32のまま (判定関数がない古いtorchも同様)
+        bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+        if bf16_supported is not None and bf16_supported():
+            return True, torch.bfloat16
+        return False, torch.float32
+
+
+def _engine_worker(engine_kwargs, requests, results):
+    """
+    推論プロセスの本体: (コマンド, 局面) を受け取って処理する (None を受け取ったら終了)
+    "search" は探索結果、"advance" は完了の応答 (None) を返す
+    初期化の完了時に None、例外時はその例外を結果キューへ入れる
+    """
+    setup_logger()
+    try:
+        engine = AIEngine(**engine_kwargs)
+        results.put(None)
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            command, game = request
+            if command == "advance":
+                engine.advance(game)
+                results.put(None)
+            else:
+                results.put(engine.search(game))
+    except BaseException as exc:  # pylint: disable=broad-except
+        results.put(exc)
+
+
+class EngineProcess:
+    """
+    AIEngineを別プロセス (spawn) で動かすプロキシ
+    モデルとCUDAコンテキストは子プロセスだけが持ち、対局側のプロセスは入力待ちの間GPUを握らない
+    """
+
+    def __init__(self, **engine_kwargs):
+        ctx = mp.get_context("spawn")
+        self._requests = ctx.Queue()
+        self._results = ctx.Queue()
+        self._process = ctx.Process(
+            target=_engine_worker,
+            args=(engine_kwargs, self._requests, self._results),
+            daemon=True,
+        )
+        self._process.start()
+        # モデルのロード・コンパイルが終わるまで待つ
+        self._receive()
+
+    def _receive(self):
+        result = self._results.get()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def search(self, game):
+        self._requests.put(("search", game))
+        return self._receive()
+
+    def advance(self, game):
+        # 完了を待ち、失敗した場合はこの呼び出しで例外を送出する (応答と要求の対応を崩さない)
+        self._requests.put(("advance", game))
+        self._receive()
+
+    def close(self):
+        if self._process.is_alive():
+            self._requests.put(None)
+        self._process.join()
 
-        # MCTS初期化
-        self.mcts = MCTS(network=self.model, device=self.device)
+
+class HumanVsAI:
+    def __init__(
+        self,
+        model_path,
+        num_simulations=50,
+        human_player=P1,
+        mcts_batch_size=16,
+        compile_network=False,
+        inference_process=False,
+    ):
+        """
+        Args:
+            model_path: 学習済みモデルのパス
+            num_simulations: MCTSのシミュレーション回数
+            human_player: 人間が操作するプレイヤー (P1 or P2)
+            mcts_batch_size: MCTSで1回の推論にまとめる葉の数
+            compile_network: torch.compileでモデルをコンパイルするか
+            inference_process: モデルとMCTSを別プロセスで動かすか
+        """
+        self.human_player = human_player
+        self.ai_player = OPPONENT[human_player]
+        self.action_history = []
+        # ランダムな行動 (デバッグ用) の乱数生成器
+        self._rng = np.random.default_rng()
+
+        # AIの思考部分 (モデル・MCTS)
+        engine_kwargs = dict(
+            model_path=model_path,
+            num_simulations=num_simulations,
+            mcts_batch_size=mcts_batch_size,
+            compile_network=compile_network,
+        )
+        if inference_process:
+            self.engine = EngineProcess(**engine_kwargs)
+        else:
+            self.engine = AIEngine(**engine_kwargs)
 
         # ゲーム初期化
         self.game = ContrastGame()
 
-    def display_board(self):
-        """盤面を表示"""
-        print("\n" + "=" * 50)
-        print("現在の盤面:")
-        print("=" * 50)
+    def close(self):
+        """AIの推論プロセスなどを終了する"""
+        self.engine.close()
 
-        # タイルの表示
-        tile_symbols = {TILE_WHITE: "□", TILE_BLACK: "■", TILE_GRAY: "▦"}
-
-        # 列番号
-        print("   ", end="")
-        for x in range(5):
-            print(f" {x} ", end="")
-        print()
-
-        for y in range(5):
-            print(f" {y} ", end="")
-            for x in range(5):
-                piece = self.game.pieces[y, x]
-                tile = self.game.tiles[y, x]
-
-                if piece == P1:
-                    symbol = f"[1{tile_symbols[tile]}]"
-                elif piece == P2:
-                    symbol = f"[2{tile_symbols[tile]}]"
-                else:
-                    symbol = f" {tile_symbols[tile]} "
-
-                print(symbol, end="")
-            print()
-
-        print("\n持ちタイル:")
-        print(
-            f"  プレイヤー1: 黒={self.game.tile_counts[0, 0]}, グレー={self.game.tile_counts[0, 1]}"
-        )
-        print(
-            f"  プレイヤー2: 黒={self.game.tile_counts[1, 0]}, グレー={self.game.tile_counts[1, 1]}"
-        )
-        print(f"\n手数: {self.game.move_count}")
-        print("=" * 50)
+    def display_board(self):
+        """盤面を表示 (1フレーム分の文字列を組み立てて1回で書き出す)"""
+        # 各マスは (タイル, 駒) の表から引く
+        cells = [
+            _CELL_LUT[cell]
+            for cell in zip(self.game.tiles.ravel().tolist(), self.game.pieces.ravel().tolist())
+        ]
+        p1_black, p1_gray = self.game.tile_counts_of(P1)
+        p2_black, p2_gray = self.game.tile_counts_of(P2)
+
+        lines = ["", "=" * 50, "現在の盤面:", "=" * 50, _COLUMN_HEADER]
+        lines.extend(f" {y} " + "".join(cells[y * 5 : y * 5 + 5]) for y in range(5))
+        lines += [
+            "",
+            "持ちタイル:",
+            f"  プレイヤー1: 黒={p1_black}, グレー={p1_gray}",
+            f"  プレイヤー2: 黒={p2_black}, グレー={p2_gray}",
+            "",
+            f"手数: {self.game.move_count}",
+            "=" * 50,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_human_action(self):
         """人間から行動を入力"""
@@ -143,9 +313,9 @@ class HumanVsAI:
                 continue
 
         # タイル配置を選択
-        p_idx = self.game.current_player - 1
-        has_black = self.game.tile_counts[p_idx, 0] > 0
-        has_gray = self.game.tile_counts[p_idx, 1] > 0
+        num_black, num_gray = self.game.tile_counts_of(self.game.current_player)
+        has_black = num_black > 0
+        has_gray = num_gray > 0
 
         tile_type = 0  # デフォルトはタイルなし
         tile_x, tile_y = 0, 0
@@ -154,7 +324,7 @@ class HumanVsAI:
             while True:
                 try:
                     tile_choice = input(
-                        f"タイルを配置しますか? (0:なし, 1:黒タイル[残{self.game.tile_counts[p_idx, 0]}], 2:グレータイル[残{self.game.tile_counts[p_idx, 1]}]): "
+                        f"タイルを配置しますか? (0:なし, 1:黒タイル[残{num_black}], 2:グレータイル[残{num_gray}]): "
                     ).strip()
 
                     if tile_choice == "0":
@@ -224,14 +394,12 @@ class HumanVsAI:
 
     def get_random_action(self):
         """ランダムな行動を取得（デバッグ用）"""
-        import random
-
-        valid_actions = self.game.get_all_legal_actions()
-        if not valid_actions:
+        valid_actions = self.game.legal_actions_array()
+        if valid_actions.size == 0:
             logger.error("有効なアクションがありません")
             return None
 
-        action = random.choice(valid_actions)
+        action = int(valid_actions[self._rng.integers(valid_actions.size)])
         logger.debug(f"ランダムに選択された行動: {action}")
         self.action_history.append((action, self.game.current_player, None))
         return action
@@ -240,8 +408,7 @@ class HumanVsAI:
         """AIの行動を取得"""
         print(f"\nAIの思考中... (プレイヤー{self.ai_player})")
 
-        # MCTS実行
-        policy, values = self.mcts.search(self.game, self.num_simulations)
+        policy, values = self.engine.search(self.game)
 
         if not policy:
             logger.error("AIが行動を選択できませんでした")
@@ -251,28 +418,8 @@ class HumanVsAI:
         action = max(policy, key=policy.get)
         value = values.get(action, 0.0)
 
-        # アクションを解釈して表示
-        move_idx, tile_idx = decode_action(action)
-
-        from_idx = move_idx // 25
-        to_idx = move_idx % 25
-        fx, fy = from_idx % 5, from_idx // 5
-        tx, ty = to_idx % 5, to_idx // 5
-
-        print(f"AIの行動: ({fx},{fy}) → ({tx},{ty})", end="")
-
-        if tile_idx > 0:
-            if tile_idx <= 25:
-                tile_type = "黒タイル"
-                idx = tile_idx - 1
-            else:
-                tile_type = "グレータイル"
-                idx = tile_idx - 26
-
-            tile_x, tile_y = idx % 5, idx // 5
-            print(f" + {tile_type}を({tile_x},{tile_y})に配置", end="")
-
-        print(f" (評価値: {value:.3f})")
+        # アクションを解釈して表示 (デコード済みの表を引く)
+        print(f"AIの行動: {_format_action(action)} (評価値: {value:.3f})")
 
         self.action_history.append((action, self.game.current_player, value))
         return action
@@ -299,6 +446,9 @@ class HumanVsAI:
 
             # アクション実行
             done, winner = self.game.step(action)
+            if not done:
+                # 人間・AIどちらの手でも、指した手の部分木をAIの次の探索に引き継ぐ
+                self.engine.advance(self.game)
 
             self.display_board()
 
@@ -320,27 +470,21 @@ class HumanVsAI:
         print(f"総手数: {self.game.move_count}")
         print("=" * 50)
         print("行動履歴:")
-        for idx, (action, player, value) in enumerate(self.action_history):
-            move_idx, tile_idx = decode_action(action)
-            from_idx = move_idx // 25
-            to_idx = move_idx % 25
-            fx, fy = from_idx % 5, from_idx // 5
-            tx, ty = to_idx % 5, to_idx // 5
+        # 全アクションをデコード済みの表から一括で引き、ループでは整形だけを行う
+        actions = np.fromiter(
+            (action for action, _, _ in self.action_history),
+            dtype=np.int32,
+            count=len(self.action_history),
+        )
+        rows = _ACTION_LUT[actions].tolist()
 
+        for idx, ((action, player, value), decoded) in enumerate(
+            zip(self.action_history, rows)
+        ):
             action_str = (
-                f"手数 {idx + 1}: プレイヤー{player} の行動: ({fx},{fy}) → ({tx},{ty})"
+                f"手数 {idx + 1}: プレイヤー{player} の行動: "
+                f"{_format_action(action, decoded)}"
             )
-            if tile_idx > 0:
-                if tile_idx <= 25:
-                    tile_type = "黒タイル"
-                    idx_tile = tile_idx - 1
-                else:
-                    tile_type = "グレータイル"
-                    idx_tile = tile_idx - 26
-
-                tile_x, tile_y = idx_tile % 5, idx_tile // 5
-                action_str += f" + {tile_type}を({tile_x},{tile_y})に配置"
-
             if value is not None:
                 action_str += f" | 評価値: {value:.3f}"
 
@@ -368,6 +512,22 @@ def main():
         default=1,
         help="人間が操作するプレイヤー (1 or 2, デフォルト: 1)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16,
+        help="MCTSで1回の推論にまとめる葉の数 (デフォルト: 16)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="torch.compileでモデルをコンパイルしてから対局する",
+    )
+    parser.add_argument(
+        "--inference-process",
+        action="store_true",
+        help="モデルとMCTSを別プロセスで動かし、入力待ちの間このプロセスがGPUを持たないようにする",
+    )
 
     args = parser.parse_args()
 
@@ -379,6 +539,9 @@ def main():
         model_path=args.model,
         num_simulations=args.simulations,
         human_player=args.player,
+        mcts_batch_size=args.batch_size,
+        compile_network=args.compile,
+        inference_process=args.inference_process,
     )
 
     try:
@@ -386,6 +549,8 @@ def main():
     except KeyboardInterrupt:
         print("\n\nゲームを中断しました")
         logger.info("Game interrupted by user")
+    finally:
+        game.close()
 
 
 if __name__ == "__main__":
@@ -10,44 +10,61 @@ import torch
 
 from contrast_game import ContrastGame
 from mcts import MCTS
-from model import ContrastDualPolicyNet
+from model import ContrastDualPolicyNet, compile_for_inference
 
 MOVE_SIZE = 25 * 25  # from ContrastDualPolicyNet
 TILE_SIZE = 51
 
 
 class ConstantNetwork(torch.nn.Module):
-    """Tiny stub network that emits constant logits and value."""
+    """Tiny stub network that emits constant logits and value.
+
+    The outputs are single-row buffers expanded to the batch size, so a forward
+    pass allocates nothing and works for any MCTS batch size.
+    """
 
     def __init__(self, value: float):
         super().__init__()
         self.register_buffer("constant_value", torch.tensor([[value]], dtype=torch.float32))
+        self.register_buffer("zero_move_logits", torch.zeros(1, MOVE_SIZE, dtype=torch.float32))
+        self.register_buffer("zero_tile_logits", torch.zeros(1, TILE_SIZE, dtype=torch.float32))
 
     def forward(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         batch = x.size(0)
-        move_logits = torch.zeros(batch, MOVE_SIZE, dtype=torch.float32, device=x.device)
-        tile_logits = torch.zeros(batch, TILE_SIZE, dtype=torch.float32, device=x.device)
+        move_logits = self.zero_move_logits.expand(batch, MOVE_SIZE)
+        tile_logits = self.zero_tile_logits.expand(batch, TILE_SIZE)
         value = self.constant_value.expand(batch, 1)
         return move_logits, tile_logits, value
 
 
-def _load_network(weights_path: str | None, device: torch.device, const_value: float) -> torch.nn.Module:
+def _load_network(
+    weights_path: str | None, device: torch.device, const_value: float, compile_network: bool = False
+) -> torch.nn.Module:
+    net = _build_network(weights_path, device, const_value)
+    if compile_network:
+        net = compile_for_inference(net, device, log=print)
+    return net
+
+
+def _build_network(weights_path: str | None, device: torch.device, const_value: float) -> torch.nn.Module:
     if weights_path:
         weights = Path(weights_path)
         if not weights.exists():
             raise FileNotFoundError(f"Weights file not found: {weights}")
 
-        net = ContrastDualPolicyNet().to(device)
-        state = torch.load(weights, map_location=device)
+        # Memory-map the checkpoint and adopt its tensors as parameters (no intermediate copy),
+        # then move the finished module to the target device
+        net = ContrastDualPolicyNet()
+        state = torch.load(weights, map_location="cpu", mmap=True)
         if isinstance(state, dict) and "state_dict" in state:
             state = state["state_dict"]
-        missing, unexpected = net.load_state_dict(state, strict=False)
+        missing, unexpected = net.load_state_dict(state, strict=False, assign=True)
         if missing:
             print(f"Warning: missing keys {missing}")
         if unexpected:
             print(f"Warning: unexpected keys {unexpected}")
         print(f"Loaded weights from {weights}")
-        return net
+        return net.to(device)
 
     net = ConstantNetwork(const_value).to(device)
     print(f"Using constant stub network (value={const_value})")
@@ -61,18 +78,24 @@ def main() -> None:
     parser.add_argument("--sims", type=int, default=16, help="Number of MCTS simulations")
     parser.add_argument("--device", type=str, default="cpu", help="Torch device string (cpu, cuda, cuda:0, ...)")
     parser.add_argument("--eps", type=float, default=0.0, help="Dirichlet noise epsilon passed to MCTS")
+    parser.add_argument("--compile", action="store_true", help="Compile the network with torch.compile")
     args = parser.parse_args()
 
     device = torch.device(args.device)
+    if device.type == "cuda":
+        # Input shape is fixed at (B, 90, 5, 5), so let cuDNN pick the fastest conv kernel once
+        torch.backends.cudnn.benchmark = True
+        torch.set_float32_matmul_precision("high")
     game = ContrastGame()
-    net = _load_network(args.weights, device, args.value)
+    net = _load_network(args.weights, device, args.value, args.compile)
     mcts = MCTS(network=net, device=device, epsilon=args.eps)
+    if args.compile:
+        # Trace / capture on the same stream and shape the search uses
+        mcts.warmup()
 
-    net.eval()
-    with torch.no_grad():
-        input_tensor = torch.from_numpy(game.encode_state()).unsqueeze(0).to(device)
-        _, _, raw_value = net(input_tensor)
-        raw_value = raw_value.item()
+    # Reuse the MCTS inference path (pinned staging buffer + non_blocking copy on CUDA)
+    _, _, raw_values = mcts.evaluate(game.encode_state()[None])
+    raw_value = float(raw_values[0])
 
     policy, values = mcts.search(game, args.sims)
 
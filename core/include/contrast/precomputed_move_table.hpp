@@ -9,2200 +9,694 @@ constexpr int kMaxDirections = 8;
 constexpr int kTileTypeCount = 3;
 constexpr int kBoardSize = BOARD_W * BOARD_H;
 
-struct PrecomputedDirection {
-    uint8_t step_count;
-    int8_t rel_index[kMaxRayLength];
+// Number of ray directions for each [tile type][origin cell]
+inline constexpr uint8_t kDirCount[kTileTypeCount][kBoardSize] = {
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
 };
 
-struct MoveTableEntry {
-    uint8_t dir_count;
-    PrecomputedDirection dirs[kMaxDirections];
+// Number of in-board steps along each [tile type][origin cell][direction]
+inline constexpr uint8_t kStepCount[kTileTypeCount][kBoardSize][kMaxDirections] = {
+    4, 0, 4, 0, 0, 0, 0, 0,
+    3, 1, 4, 0, 0, 0, 0, 0,
+    2, 2, 4, 0, 0, 0, 0, 0,
+    1, 3, 4, 0, 0, 0, 0, 0,
+    0, 4, 4, 0, 0, 0, 0, 0,
+    4, 0, 3, 1, 0, 0, 0, 0,
+    3, 1, 3, 1, 0, 0, 0, 0,
+    2, 2, 3, 1, 0, 0, 0, 0,
+    1, 3, 3, 1, 0, 0, 0, 0,
+    0, 4, 3, 1, 0, 0, 0, 0,
+    4, 0, 2, 2, 0, 0, 0, 0,
+    3, 1, 2, 2, 0, 0, 0, 0,
+    2, 2, 2, 2, 0, 0, 0, 0,
+    1, 3, 2, 2, 0, 0, 0, 0,
+    0, 4, 2, 2, 0, 0, 0, 0,
+    4, 0, 1, 3, 0, 0, 0, 0,
+    3, 1, 1, 3, 0, 0, 0, 0,
+    2, 2, 1, 3, 0, 0, 0, 0,
+    1, 3, 1, 3, 0, 0, 0, 0,
+    0, 4, 1, 3, 0, 0, 0, 0,
+    4, 0, 0, 4, 0, 0, 0, 0,
+    3, 1, 0, 4, 0, 0, 0, 0,
+    2, 2, 0, 4, 0, 0, 0, 0,
+    1, 3, 0, 4, 0, 0, 0, 0,
+    0, 4, 0, 4, 0, 0, 0, 0,
+    4, 0, 0, 0, 0, 0, 0, 0,
+    3, 0, 1, 0, 0, 0, 0, 0,
+    2, 0, 2, 0, 0, 0, 0, 0,
+    1, 0, 3, 0, 0, 0, 0, 0,
+    0, 0, 4, 0, 0, 0, 0, 0,
+    3, 1, 0, 0, 0, 0, 0, 0,
+    3, 1, 1, 1, 0, 0, 0, 0,
+    2, 1, 2, 1, 0, 0, 0, 0,
+    1, 1, 3, 1, 0, 0, 0, 0,
+    0, 0, 3, 1, 0, 0, 0, 0,
+    2, 2, 0, 0, 0, 0, 0, 0,
+    2, 2, 1, 1, 0, 0, 0, 0,
+    2, 2, 2, 2, 0, 0, 0, 0,
+    1, 1, 2, 2, 0, 0, 0, 0,
+    0, 0, 2, 2, 0, 0, 0, 0,
+    1, 3, 0, 0, 0, 0, 0, 0,
+    1, 3, 1, 1, 0, 0, 0, 0,
+    1, 2, 1, 2, 0, 0, 0, 0,
+    1, 1, 1, 3, 0, 0, 0, 0,
+    0, 0, 1, 3, 0, 0, 0, 0,
+    0, 4, 0, 0, 0, 0, 0, 0,
+    0, 3, 0, 1, 0, 0, 0, 0,
+    0, 2, 0, 2, 0, 0, 0, 0,
+    0, 1, 0, 3, 0, 0, 0, 0,
+    0, 0, 0, 4, 0, 0, 0, 0,
+    4, 0, 4, 0, 4, 0, 0, 0,
+    3, 1, 4, 0, 3, 0, 1, 0,
+    2, 2, 4, 0, 2, 0, 2, 0,
+    1, 3, 4, 0, 1, 0, 3, 0,
+    0, 4, 4, 0, 0, 0, 4, 0,
+    4, 0, 3, 1, 3, 1, 0, 0,
+    3, 1, 3, 1, 3, 1, 1, 1,
+    2, 2, 3, 1, 2, 1, 2, 1,
+    1, 3, 3, 1, 1, 1, 3, 1,
+    0, 4, 3, 1, 0, 0, 3, 1,
+    4, 0, 2, 2, 2, 2, 0, 0,
+    3, 1, 2, 2, 2, 2, 1, 1,
+    2, 2, 2, 2, 2, 2, 2, 2,
+    1, 3, 2, 2, 1, 1, 2, 2,
+    0, 4, 2, 2, 0, 0, 2, 2,
+    4, 0, 1, 3, 1, 3, 0, 0,
+    3, 1, 1, 3, 1, 3, 1, 1,
+    2, 2, 1, 3, 1, 2, 1, 2,
+    1, 3, 1, 3, 1, 1, 1, 3,
+    0, 4, 1, 3, 0, 0, 1, 3,
+    4, 0, 0, 4, 0, 4, 0, 0,
+    3, 1, 0, 4, 0, 3, 0, 1,
+    2, 2, 0, 4, 0, 2, 0, 2,
+    1, 3, 0, 4, 0, 1, 0, 3,
+    0, 4, 0, 4, 0, 0, 0, 4,
 };
 
-inline constexpr MoveTableEntry kMoveTable[kTileTypeCount][kBoardSize] = {
-// TileType::None
-{
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-},
-// TileType::Black
-{
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +6, +12, +18, +24 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +4, +8, +12, +16 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -4, -8, -12, -16 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-    {
-        static_cast<uint8_t>(4),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -6, -12, -18, -24 }
-            },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-            { 0, { +0, +0, +0, +0 } },
-        }
-    },
-},
-// TileType::Gray
-{
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +6, +12, +18, +24 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +5, +10, +15, +20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { +4, +8, +12, +16 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +6, +12, +18, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +5, +10, +15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { +4, +8, +12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +6, +12, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +5, +10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -5, -10, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { +4, +8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +6, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +5, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -5, -10, -15, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { +4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(4),
-                { +1, +2, +3, +4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -4, -8, -12, -16 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(3),
-                { +1, +2, +3, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -4, -8, -12, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -6, +0, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(2),
-                { +1, +2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -1, -2, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -4, -8, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(2),
-                { -6, -12, +0, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(1),
-                { +1, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -1, -2, -3, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(1),
-                { -4, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(3),
-                { -6, -12, -18, +0 }
-            },
-        }
-    },
-    {
-        static_cast<uint8_t>(8),
-        {
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -1, -2, -3, -4 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -5, -10, -15, -20 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(0),
-                { +0, +0, +0, +0 }
-            },
-            {
-                static_cast<uint8_t>(4),
-                { -6, -12, -18, -24 }
-            },
-        }
-    },
-},
+// Cell offset of each step relative to the origin (zero-padded to kMaxRayLength)
+inline constexpr int8_t kRelIdx[kTileTypeCount][kBoardSize][kMaxDirections][kMaxRayLength] = {
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +18, +24,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +18, +0,
+    +0, +0, +0, +0,
+    +4, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +16,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +18, +0,
+    -4, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +18, +0,
+    -4, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +12, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, -8, -12, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, -8, -12, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, -8, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, -18, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, -18, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -4, -8, -12, -16,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -4, -8, -12, +0,
+    +0, +0, +0, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -4, -8, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -4, +0, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, -18, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, -18, -24,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +6, +12, +18, +24,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +6, +12, +18, +0,
+    +0, +0, +0, +0,
+    +4, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +6, +12, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +0, +0,
+    +0, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +6, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +15, +20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +16,
+    +0, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +6, +12, +18, +0,
+    -4, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +6, +12, +18, +0,
+    -4, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +6, +12, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, +0, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +12, +0,
+    -6, +0, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +15, +0,
+    -5, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +12, +0,
+    -6, +0, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +6, +12, +0, +0,
+    -4, -8, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +10, +0, +0,
+    -5, -10, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +8, +0, +0,
+    -6, -12, +0, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +6, +0, +0, +0,
+    -4, -8, -12, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +6, +0, +0, +0,
+    -4, -8, -12, +0,
+    +4, +0, +0, +0,
+    -6, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +6, +0, +0, +0,
+    -4, -8, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +6, +0, +0, +0,
+    -4, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, -18, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +5, +0, +0, +0,
+    -5, -10, -15, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +4, +0, +0, +0,
+    -6, -12, -18, +0,
+    +1, +2, +3, +4,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    -4, -8, -12, -16,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +1, +2, +3, +0,
+    -1, +0, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    -4, -8, -12, +0,
+    +0, +0, +0, +0,
+    -6, +0, +0, +0,
+    +1, +2, +0, +0,
+    -1, -2, +0, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    -4, -8, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, +0, +0,
+    +1, +0, +0, +0,
+    -1, -2, -3, +0,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    -4, +0, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, -18, +0,
+    +0, +0, +0, +0,
+    -1, -2, -3, -4,
+    +0, +0, +0, +0,
+    -5, -10, -15, -20,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    +0, +0, +0, +0,
+    -6, -12, -18, -24,
 };
-}
\ No newline at end of file
+
+}
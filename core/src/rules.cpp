@@ -20,16 +20,18 @@ void Rules::legal_moves(const GameState& s, MoveList& out) {
       const auto tile = b.at(x, y).tile;
       const auto tile_index = static_cast<int>(tile);
       const int origin_index = y * b.width() + x;
-      const auto& table_entry = kMoveTable[tile_index][origin_index];
+      const uint8_t dir_count = kDirCount[tile_index][origin_index];
+      const uint8_t* step_counts = kStepCount[tile_index][origin_index];
 
-      for (uint8_t dir_idx = 0; dir_idx < table_entry.dir_count; ++dir_idx) {
-        const auto& dir = table_entry.dirs[dir_idx];
-        if (dir.step_count == 0) continue;
+      for (uint8_t dir_idx = 0; dir_idx < dir_count; ++dir_idx) {
+        const uint8_t step_count = step_counts[dir_idx];
+        if (step_count == 0) continue;
+        const int8_t* rel_index = kRelIdx[tile_index][origin_index][dir_idx];
 
         bool encountered_friend = false;
 
-        for (uint8_t step = 0; step < dir.step_count; ++step) {
-          int target_index = origin_index + dir.rel_index[step];
+        for (uint8_t step = 0; step < step_count; ++step) {
+          int target_index = origin_index + rel_index[step];
           int ty = target_index / b.width();
           int tx = target_index % b.width();
           const auto& cell = b.at(tx, ty);
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from pathlib import Path
 
+import numpy as np
+
 BOARD_W = 5
 BOARD_H = 5
 TILE_TYPES = ["None", "Black", "Gray"]
@@ -16,69 +18,85 @@ dirs_map = {
 board_size = BOARD_W * BOARD_H
 
 def compute_table():
+    # (25, 2) 各マスの (x, y)
+    origins = np.stack(
+        np.meshgrid(np.arange(BOARD_W), np.arange(BOARD_H), indexing="xy"), axis=-1
+    ).reshape(board_size, 2)
+    origin_idx = origins[:, 1] * BOARD_W + origins[:, 0]
+    # (MAX_RAY, 1, 1) 進むマス数
+    steps = np.arange(1, MAX_RAY + 1)[:, None, None]
+
     table = []
     for tile_idx in range(len(TILE_TYPES)):
-        tile_entries = []
-        for idx in range(board_size):
-            x = idx % BOARD_W
-            y = idx // BOARD_W
-            dirs = dirs_map[tile_idx]
-            dir_entries = []
-            for dx, dy in dirs:
-                rel_indices = []
-                cx, cy = x, y
-                for _ in range(MAX_RAY):
-                    cx += dx
-                    cy += dy
-                    if not (0 <= cx < BOARD_W and 0 <= cy < BOARD_H):
-                        break
-                    rel_idx = (cy * BOARD_W + cx) - (y * BOARD_W + x)
-                    rel_indices.append(rel_idx)
-                dir_entries.append(rel_indices)
-            tile_entries.append(dir_entries)
-        table.append(tile_entries)
+        dirs = np.array(dirs_map[tile_idx])
+        # (25, MAX_RAY, D, 2) 到達するマスの絶対座標
+        coords = origins[:, None, None, :] + steps[None] * dirs[None, None]
+        cx, cy = coords[..., 0], coords[..., 1]
+        in_bounds = (cx >= 0) & (cx < BOARD_W) & (cy >= 0) & (cy < BOARD_H)
+        # 盤外に出たらその先は数えない (一度Falseになったら以降もFalse)
+        in_ray = np.cumprod(in_bounds, axis=1).astype(bool)
+        rel = (cy * BOARD_W + cx) - origin_idx[:, None, None]
+        step_counts = in_ray.sum(axis=1)  # (25, D)
+
+        # (25, D, MAX_RAY) に並べ替え、有効なステップ数だけ切り出す
+        rel = rel.transpose(0, 2, 1).tolist()
+        step_counts = step_counts.tolist()
+        table.append(
+            [
+                [rel_row[:count] for rel_row, count in zip(rel[idx], step_counts[idx])]
+                for idx in range(board_size)
+            ]
+        )
     return table
 
-def format_array(rel_values):
-    padded = rel_values + [0] * (MAX_RAY - len(rel_values))
-    return ", ".join(f"{v:+d}" for v in padded)
+def build_soa(table: list):
+    """ネストしたリストの表を、ヘッダに出力する3つの配列 (SoA) に詰める"""
+    dir_count = np.zeros((len(TILE_TYPES), board_size), dtype=np.uint8)
+    step_count = np.zeros((len(TILE_TYPES), board_size, MAX_DIRS), dtype=np.uint8)
+    rel_idx = np.zeros((len(TILE_TYPES), board_size, MAX_DIRS, MAX_RAY), dtype=np.int8)
+    for tile_idx, tile_entries in enumerate(table):
+        for idx, entry in enumerate(tile_entries):
+            dir_count[tile_idx, idx] = len(entry)
+            for dir_idx, rel_indices in enumerate(entry):
+                step_count[tile_idx, idx, dir_idx] = len(rel_indices)
+                rel_idx[tile_idx, idx, dir_idx, : len(rel_indices)] = rel_indices
+    return dir_count, step_count, rel_idx
+
+def format_table(arr: np.ndarray, fmt: str) -> str:
+    # 最内側の次元ごとに1行、全体を1つの{}にフラットに並べる
+    rows = arr.reshape(-1, arr.shape[-1]).tolist()
+    return "\n".join("    " + ", ".join(fmt.format(v) for v in row) + "," for row in rows)
 
 def emit_header(table: list, path: Path):
-    header = []
-    header.append("#pragma once")
-    header.append("#include \"contrast/types.hpp\"")
-    header.append("#include <cstdint>\n")
-    header.append("namespace contrast {\n")
-    header.append("constexpr int kMaxRayLength = (BOARD_W > BOARD_H ? BOARD_W : BOARD_H) - 1;")
-    header.append("constexpr int kMaxDirections = 8;")
-    header.append("constexpr int kTileTypeCount = 3;")
-    header.append("constexpr int kBoardSize = BOARD_W * BOARD_H;\n")
-    header.append("struct PrecomputedDirection {\n    uint8_t step_count;\n    int8_t rel_index[kMaxRayLength];\n};\n")
-    header.append("struct MoveTableEntry {\n    uint8_t dir_count;\n    PrecomputedDirection dirs[kMaxDirections];\n};\n")
-    header.append("inline constexpr MoveTableEntry kMoveTable[kTileTypeCount][kBoardSize] = {")
+    dir_count, step_count, rel_idx = build_soa(table)
+    path.write_text(f"""#pragma once
+#include "contrast/types.hpp"
+#include <cstdint>
 
-    for tile_idx, tile_entries in enumerate(table):
-        header.append("// TileType::{}".format(TILE_TYPES[tile_idx]))
-        header.append("{")
-        for entry in tile_entries:
-            header.append("    {")
-            header.append(f"        static_cast<uint8_t>({len(entry)}),")
-            header.append("        {")
-            for dir_idx in range(MAX_DIRS):
-                if dir_idx < len(entry):
-                    rel_indices = entry[dir_idx]
-                    step_count = len(rel_indices)
-                    header.append("            {" )
-                    header.append(f"                static_cast<uint8_t>({step_count}),")
-                    header.append("                { " + format_array(rel_indices) + " }")
-                    header.append("            },")
-                else:
-                    header.append("            { 0, { " + format_array([]) + " } },")
-            header.append("        }")
-            header.append("    },")
-        header.append("},")
-    header.append("};\n}")
-    path.write_text("\n".join(header))
+namespace contrast {{
+
+constexpr int kMaxRayLength = (BOARD_W > BOARD_H ? BOARD_W : BOARD_H) - 1;
+constexpr int kMaxDirections = 8;
+constexpr int kTileTypeCount = 3;
+constexpr int kBoardSize = BOARD_W * BOARD_H;
+
+// Number of ray directions for each [tile type][origin cell]
+inline constexpr uint8_t kDirCount[kTileTypeCount][kBoardSize] = {{
+{format_table(dir_count, "{:d}")}
+}};
+
+// Number of in-board steps along each [tile type][origin cell][direction]
+inline constexpr uint8_t kStepCount[kTileTypeCount][kBoardSize][kMaxDirections] = {{
+{format_table(step_count, "{:d}")}
+}};
+
+// Cell offset of each step relative to the origin (zero-padded to kMaxRayLength)
+inline constexpr int8_t kRelIdx[kTileTypeCount][kBoardSize][kMaxDirections][kMaxRayLength] = {{
+{format_table(rel_idx, "{:+d}")}
+}};
+
+}}
+""")
 
 if __name__ == "__main__":
     output_path = Path(__file__).resolve().parents[1] / "core" / "include" / "contrast" / "precomputed_move_table.hpp"